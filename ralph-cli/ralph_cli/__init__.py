@@ -2,7 +2,13 @@
 
 from importlib.metadata import PackageNotFoundError, version
 
-try:
-    __version__ = version("ralph-cli")
-except PackageNotFoundError:
-    __version__ = "0.0.0"
+
+def _resolve_version() -> str:
+    """Installed package version, or 0.0.0 when running without metadata."""
+    try:
+        return version("ralph-cli")
+    except PackageNotFoundError:
+        return "0.0.0"
+
+
+__version__ = _resolve_version()
@@ -34,6 +34,10 @@ SECTIONS: list[tuple[str, list[str]]] = [
         "Review",
         ["claude_review_model", "code_review_max_iterations", "security_review_max_iterations"],
     ),
+    (
+        "Throttling",
+        ["max_claude_concurrency", "claude_rpm"],
+    ),
     (
         "Codex",
         ["codex_review_max_iterations", "codex_review_model", "codex_plan_review_enabled"],
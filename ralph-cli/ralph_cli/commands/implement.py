@@ -11,7 +11,7 @@ from ..errors import ErrorType
 from ..executor import TaskResult, build_prompt, expand_task_ranges, run_claude
 from ..git import cleanup_working_dir, get_head_commit
 from ..logging import SessionLog, format_duration
-from ..metrics import submit_session_metrics
+from ..metrics import submit_session_metrics_background
 from ..notify import Notifier
 from ..recovery import recovery_loop, should_recover, should_retry_fresh
 
@@ -209,6 +209,7 @@ def run_implement(
         Completed=[str(t) for t in completed],
         Failed=[f"{t} ({failed_reasons[i]})" for i, t in enumerate(failed)],
     )
+    session_log.close()
 
     console.rule("[bold blue]Session Complete[/bold blue]")
     console.print(f"Duration: [green]{duration}[/green]")
@@ -232,8 +233,9 @@ def run_implement(
         project_stats=project_stats,
     )
 
-    # Submit metrics (token counts and task_executions not yet available)
-    submit_session_metrics(
+    # Submit metrics (token counts and task_executions not yet available);
+    # sent in the background while the batch check runs
+    submit_session_metrics_background(
         command_type="implement",
         project=project,
         started_at=start_time,
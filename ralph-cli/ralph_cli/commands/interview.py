@@ -100,6 +100,7 @@ def run_interview(
         Completed=[str(t) for t in completed],
         Failed=[str(t) for t in failed],
     )
+    session_log.close()
 
     console.rule("[bold blue]Session Complete[/bold blue]")
     console.print(f"Duration: [green]{duration}[/green]")
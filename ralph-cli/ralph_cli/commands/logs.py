@@ -1,8 +1,11 @@
 """Logs command - view and manage log files."""
 
+import heapq
+import os
 import subprocess
 from datetime import datetime
 from enum import Enum
+from operator import itemgetter
 from pathlib import Path
 
 from rich.console import Console
@@ -57,31 +60,39 @@ def get_log_files(
     else:
         dirs = [log_dir / d for d in LOG_DIRS.values()]
 
+    task_safe = task_filter.replace("#", "_").lower() if task_filter else None
     logs = []
 
     for d in dirs:
-        if not d.exists():
+        try:
+            entries = os.scandir(d)
+        except OSError:
             continue
 
-        for f in d.glob("*.log"):
-            # Filter by task if specified
-            if task_filter:
-                task_safe = task_filter.replace("#", "_")
-                if task_safe.lower() not in f.name.lower():
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".log") or name.startswith("."):
                     continue
 
-            try:
-                stat = f.stat()
-                logs.append(
-                    {
-                        "path": f,
-                        "type": d.name,
-                        "mtime": datetime.fromtimestamp(stat.st_mtime),
-                        "size": stat.st_size,
-                    }
-                )
-            except OSError:
-                continue
+                # Filter by task if specified
+                if task_safe and task_safe not in name.lower():
+                    continue
+
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    logs.append(
+                        {
+                            "path": Path(entry.path),
+                            "type": d.name,
+                            "mtime": datetime.fromtimestamp(stat.st_mtime),
+                            "size": stat.st_size,
+                        }
+                    )
+                except OSError:
+                    continue
 
     return logs
 
@@ -129,6 +140,35 @@ def resolve_log_path(path: str) -> Path | None:
     return None
 
 
+def read_tail_lines(path: Path, lines: int, chunk_size: int = 8192) -> str:
+    """Read the last N lines of a file without reading the whole file.
+
+    Reads backwards from the end in binary chunks until enough newlines
+    are found, then decodes the collected bytes once.
+
+    Args:
+        path: File to read
+        lines: Number of trailing lines to return
+        chunk_size: Size of each backwards read in bytes
+
+    Returns:
+        Last N lines joined with newlines
+    """
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        data = b""
+        # One extra newline is needed to know the first kept line is complete
+        while pos > 0 and data.count(b"\n") <= lines:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+
+    content_lines = data.decode("utf-8", errors="replace").split("\n")
+    return "\n".join(content_lines[-lines:])
+
+
 def list_logs(
     log_type: LogType | None = None,
     task_filter: str | None = None,
@@ -155,9 +195,8 @@ def list_logs(
             console.print("[yellow]No logs found[/yellow]")
         return 0
 
-    # Sort by modification time, newest first
-    logs.sort(key=lambda x: x["mtime"], reverse=True)
-    logs = logs[:limit]
+    # Newest first, selecting only the top `limit` entries
+    logs = heapq.nlargest(limit, logs, key=itemgetter("mtime"))
 
     # Create table
     title = "Recent Logs"
@@ -174,14 +213,12 @@ def list_logs(
     table.add_column("Size", justify="right", width=8)
 
     for i, log in enumerate(logs, 1):
-        size_str = format_size(log["size"])
-        time_str = log["mtime"].strftime("%Y-%m-%d %H:%M")
         table.add_row(
             str(i),
             log["type"],
             log["path"].name,
-            time_str,
-            size_str,
+            log["mtime"].strftime("%Y-%m-%d %H:%M"),
+            format_size(log["size"]),
         )
 
     console.print(table)
@@ -214,8 +251,6 @@ def view_log(
     Returns:
         Exit code (0 for success, 1 for error)
     """
-    import os
-
     log_path = resolve_log_path(path)
 
     if not log_path:
@@ -244,18 +279,18 @@ def view_log(
 
     try:
         file_size = log_path.stat().st_size
-        content = log_path.read_text()
+        if lines and not head:
+            # Tail from the end instead of loading the whole file
+            content = read_tail_lines(log_path, lines)
+        else:
+            content = log_path.read_text()
     except Exception as e:
         console.print(f"[red]Error reading log: {e}[/red]")
         return 1
 
     # Limit lines if specified
-    if lines:
-        content_lines = content.split("\n")
-        if head:
-            content = "\n".join(content_lines[:lines])
-        else:
-            content = "\n".join(content_lines[-lines:])
+    if lines and head:
+        content = "\n".join(content.split("\n")[:lines])
 
     # Determine if we should use pager
     # Auto: use pager for files > 50KB (unless lines limit makes it small)
@@ -338,20 +373,22 @@ def clean_logs(
     logs = get_log_files(log_type)
     cutoff = datetime.now() - timedelta(days=days)
 
-    old_logs = [log for log in logs if log["mtime"] < cutoff]
+    old_logs = []
+    total_size = 0
+    for log in logs:
+        if log["mtime"] < cutoff:
+            old_logs.append(log)
+            total_size += log["size"]
 
     if not old_logs:
         console.print(f"[green]No logs older than {days} days[/green]")
         return 0
 
-    total_size = sum(log["size"] for log in old_logs)
-
     if dry_run:
         console.print(
             f"[yellow]Would delete {len(old_logs)} logs ({format_size(total_size)}):[/yellow]"
         )
-        for log in old_logs:
-            console.print(f"  [dim]{log['path'].name}[/dim]")
+        console.print("\n".join(f"  [dim]{log['path'].name}[/dim]" for log in old_logs))
         console.print("\n[dim]Use --no-dry-run to actually delete[/dim]")
     else:
         deleted = 0
@@ -371,7 +408,7 @@ def format_size(size: int) -> str:
     """Format file size in human-readable format."""
     if size < 1024:
         return f"{size} B"
-    elif size < 1024 * 1024:
-        return f"{size // 1024} KB"
+    elif size < 1 << 20:
+        return f"{size >> 10} KB"
     else:
-        return f"{size // (1024 * 1024)} MB"
+        return f"{size >> 20} MB"
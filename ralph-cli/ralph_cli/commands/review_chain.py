@@ -1,22 +1,29 @@
 """Review chain orchestration — all review phases after main implementation."""
 
+import itertools
 import logging
-import os
+import random
 import shutil
+import signal
 import subprocess
+import sys
+import threading
 import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
+from typing import NamedTuple, TextIO
 
 from rich.console import Console
 
 from ..config import Settings
-from ..executor import run_claude
+from ..executor import TaskResult, run_claude
 from ..logging import SessionLog, format_duration
-from ..mcp import McpRegistrationError, McpReviewerRole, codex_mcp_role, mcp_role
+from ..mcp import McpRegistrationError, McpReviewerRole, codex_mcp_role, mcp_config
 from ..notify import Notifier
 from ..prompts import load_prompt
+from ..ratelimit import TokenBucket
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -37,6 +44,17 @@ class ReviewChainContext:
     main_session_id: str | None = None
     base_commit: str | None = None
     review_session_ids: dict[str, str | None] = field(default_factory=dict)
+    log_prefix: str = field(init=False, repr=False)
+    rate_limiter: TokenBucket = field(init=False, repr=False)
+    log_counter: Iterator[int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Computed once, every review step log shares it
+        self.log_prefix = f"{self.task_ref.replace('#', '_')}_"
+        # Shared by all phases so session starts are throttled chain-wide
+        self.rate_limiter = TokenBucket(self.settings.claude_rpm)
+        # Keeps log names unique for steps started within the same second
+        self.log_counter = itertools.count(1)
 
 
 @dataclass
@@ -59,20 +77,43 @@ class ReviewChainResult:
     phase_results: dict[str, ReviewPhaseResult] | None = None
 
 
-# Code review agent definitions: (agent_name, review_type, author, prompt_name)
-CODE_REVIEW_AGENTS = [
-    ("code-reviewer", "code-review", "code-reviewer", "review-code-reviewer"),
-    ("comment-analyzer", "comment-analysis", "comment-analyzer", "review-comment-analyzer"),
-    ("pr-test-analyzer", "pr-test-analysis", "pr-test-analyzer", "review-test-analyzer"),
-    (
+class ReviewAgent(NamedTuple):
+    """Code review agent definition."""
+
+    agent_name: str
+    review_type: str
+    author: str
+    prompt_name: str
+
+
+CODE_REVIEW_AGENTS: tuple[ReviewAgent, ...] = (
+    ReviewAgent("code-reviewer", "code-review", "code-reviewer", "review-code-reviewer"),
+    ReviewAgent(
+        "comment-analyzer", "comment-analysis", "comment-analyzer", "review-comment-analyzer"
+    ),
+    ReviewAgent("pr-test-analyzer", "pr-test-analysis", "pr-test-analyzer", "review-test-analyzer"),
+    ReviewAgent(
         "silent-failure-hunter",
         "silent-failure-hunting",
         "silent-failure-hunter",
         "review-silent-failure-hunter",
     ),
-]
+)
 
-CODE_REVIEW_SECTION_TYPES = [review_type for _, review_type, _, _ in CODE_REVIEW_AGENTS]
+CODE_REVIEW_SECTION_TYPES: tuple[str, ...] = tuple(
+    agent.review_type for agent in CODE_REVIEW_AGENTS
+)
+
+# Follow-up turns for resumed reviewer sessions. Kept byte-identical across
+# iterations so the resumed conversation prefix stays in the prompt cache.
+REREVIEW_PROMPT = (
+    "The implementer has fixed or declined findings. "
+    "Re-review the changes and update finding statuses."
+)
+SECURITY_REREVIEW_PROMPT = (
+    "The implementer has fixed or declined security findings. "
+    "Re-review the changes and update finding statuses."
+)
 
 
 def _parse_task_ref(task_ref: str) -> tuple[str, int]:
@@ -83,9 +124,8 @@ def _parse_task_ref(task_ref: str) -> tuple[str, int]:
 
 def _log_path(ctx: ReviewChainContext, name: str, suffix: str = "") -> Path:
     """Generate log path for a review step."""
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    task_safe = ctx.task_ref.replace("#", "_")
-    return ctx.log_dir / f"{task_safe}_{name}{suffix}_{ts}.log"
+    ts = time.strftime("%Y%m%d_%H%M%S")
+    return ctx.log_dir / f"{ctx.log_prefix}{name}{suffix}_{ts}_{next(ctx.log_counter):03d}.log"
 
 
 # ---------------------------------------------------------------------------
@@ -93,7 +133,7 @@ def _log_path(ctx: ReviewChainContext, name: str, suffix: str = "") -> Path:
 # ---------------------------------------------------------------------------
 
 
-def check_lgtm(project: str, task_number: int, section_types: list[str]) -> tuple[bool, int]:
+def check_lgtm(project: str, task_number: int, section_types: Sequence[str]) -> tuple[bool, int]:
     """Check if all findings are resolved/declined (LGTM).
 
     Returns (is_lgtm, open_findings_count).
@@ -101,10 +141,9 @@ def check_lgtm(project: str, task_number: int, section_types: list[str]) -> tupl
     rather than triggering infinite fix sessions for non-existent findings.
     """
     try:
-        from ralph_tasks.core import list_review_findings
+        from ralph_tasks.core import count_open_task_findings
 
-        findings = list_review_findings(project, task_number, status="open")
-        open_count = sum(1 for f in findings if f.get("section_type") in section_types)
+        open_count = count_open_task_findings(project, task_number, list(section_types))
         return open_count == 0, open_count
     except Exception as e:
         logger.warning("Failed to check LGTM (treating as LGTM to avoid stale loop): %s", e)
@@ -117,43 +156,50 @@ def check_lgtm(project: str, task_number: int, section_types: list[str]) -> tupl
 # ---------------------------------------------------------------------------
 
 
-def create_fixup_commit(
-    working_dir: Path,
-    session_log: SessionLog,
-    message: str = "review fixes",
-) -> None:
-    """Create fixup commit and autosquash if there are changes."""
+def _git_state(working_dir: Path) -> tuple[bool, str]:
+    """Return (has uncommitted changes, HEAD sha) from a single git status.
+
+    HEAD sha is empty when the repository has no commits yet.
+    """
     status = subprocess.run(
-        ["git", "status", "--porcelain"],
+        ["git", "status", "--porcelain=v2", "--branch"],
         cwd=working_dir,
         capture_output=True,
         text=True,
     )
-    if not status.stdout.strip():
-        return
+    dirty = False
+    head = ""
+    for line in status.stdout.splitlines():
+        if line.startswith("# branch.oid "):
+            oid = line[len("# branch.oid ") :]
+            head = "" if oid == "(initial)" else oid
+        elif not line.startswith("#"):
+            dirty = True
+    return dirty, head
 
-    log_result = subprocess.run(
-        ["git", "log", "-1", "--format=%H"],
-        cwd=working_dir,
-        capture_output=True,
-        text=True,
-    )
-    last_hash = log_result.stdout.strip()
-    if not last_hash:
+
+def create_fixup_commit(
+    working_dir: Path,
+    session_log: SessionLog,
+    message: str = "review fixes",
+) -> None:
+    """Fold uncommitted changes into the last commit if there are any.
+
+    Equivalent to a fixup commit autosquashed into HEAD, done as an amend
+    so no rebase is needed.
+    """
+    dirty, head = _git_state(working_dir)
+    if not dirty or not head:
         return
 
-    subprocess.run(["git", "add", "-A"], cwd=working_dir, capture_output=True)
-    subprocess.run(
-        ["git", "commit", f"--fixup={last_hash}"],
-        cwd=working_dir,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "rebase", "-i", "--autosquash", f"{last_hash}~1"],
-        cwd=working_dir,
-        capture_output=True,
-        env={**os.environ, "GIT_SEQUENCE_EDITOR": "true"},
-    )
+    # Output is not used, so skip the pipes
+    quiet = {"cwd": working_dir, "stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+    subprocess.run(["git", "add", "-A"], **quiet)
+    amend = subprocess.run(["git", "commit", "--amend", "--no-edit"], **quiet)
+    if amend.returncode != 0:
+        logger.warning("git commit --amend failed with exit code %d", amend.returncode)
+        session_log.append(f"Failed to create fixup commit for {message}")
+        return
 
     session_log.append(f"Created fixup commit for {message}")
     console.print(f"[dim]Fixup commit created for {message}[/dim]")
@@ -166,7 +212,7 @@ def create_fixup_commit(
 
 def run_fix_session(
     ctx: ReviewChainContext,
-    section_types: list[str],
+    section_types: Sequence[str],
     iteration: int,
 ) -> tuple[bool, float]:
     """Resume main session to fix review findings.
@@ -188,7 +234,8 @@ def run_fix_session(
         f"{' (resuming)' if ctx.main_session_id else ''}...[/cyan]"
     )
 
-    result = run_claude(
+    result = _run_claude(
+        ctx,
         prompt=prompt,
         working_dir=ctx.working_dir,
         log_path=log_path,
@@ -211,17 +258,26 @@ def run_fix_session(
 # ---------------------------------------------------------------------------
 
 
+def _run_claude(ctx: ReviewChainContext, **kwargs) -> TaskResult:
+    """Run a Claude session once the chain's rate limiter allows it."""
+    waited = ctx.rate_limiter.acquire()
+    if waited >= 1:
+        logger.info("Waited %.0fs for Claude rate limit", waited)
+    return run_claude(**kwargs)
+
+
 def run_single_review_agent(
     ctx: ReviewChainContext,
     agent_name: str,
     review_type: str,
     author: str | None = None,
     prompt_name: str = "review-code-reviewer",
+    output: TextIO | None = None,
 ) -> tuple[bool, str | None, float]:
     """Run a single review agent as a Claude session.
 
-    Switches MCP to Reviewer role (with review_type) before launching Claude,
-    restores SWE role after.
+    The session gets ralph-tasks MCP with Reviewer role (with review_type)
+    through its own --mcp-config; the global registration is left untouched.
 
     Returns (success, session_id, cost_usd).
     """
@@ -242,17 +298,15 @@ def run_single_review_agent(
 
     log_path = _log_path(ctx, agent_name)
 
-    try:
-        with mcp_role(McpReviewerRole(review_type), ctx.settings.ralph_tasks_api_key):
-            result = run_claude(
-                prompt=prompt,
-                working_dir=ctx.working_dir,
-                log_path=log_path,
-                model=ctx.settings.claude_review_model,
-            )
-    except McpRegistrationError as e:
-        console.print(f"[red]✗ {agent_name} MCP setup failed: {e}[/red]")
-        return False, None, 0.0
+    result = _run_claude(
+        ctx,
+        prompt=prompt,
+        working_dir=ctx.working_dir,
+        log_path=log_path,
+        model=ctx.settings.claude_review_model,
+        output=output or sys.stdout,
+        mcp_config=mcp_config(McpReviewerRole(review_type), ctx.settings.ralph_tasks_api_key),
+    )
 
     if result.error_type.is_success:
         console.print(
@@ -264,41 +318,99 @@ def run_single_review_agent(
     return False, result.session_id, result.cost_usd
 
 
+_RETRY_BASE_DELAY = 2.0
+_RETRY_MAX_DELAY = 30.0
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter.
+
+    Jitter keeps parallel agents that failed together from retrying in lockstep.
+    """
+    return random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2**attempt))
+
+
 def _run_agent_with_retry(
     ctx: ReviewChainContext,
     agent_name: str,
     review_type: str,
     author: str | None = None,
     prompt_name: str = "review-code-reviewer",
+    output: TextIO | None = None,
 ) -> tuple[bool, str | None, float]:
     """Run review agent with one retry on failure."""
     success, session_id, cost = run_single_review_agent(
-        ctx, agent_name, review_type, author, prompt_name
+        ctx, agent_name, review_type, author, prompt_name, output
     )
     if success:
         return True, session_id, cost
 
-    console.print(f"[yellow]Retrying {agent_name}...[/yellow]")
+    delay = _retry_delay(1)
+    console.print(f"[yellow]Retrying {agent_name} in {delay:.0f}s...[/yellow]")
     ctx.session_log.append(f"Retrying {agent_name} after failure")
+    time.sleep(delay)
     retry_success, retry_sid, retry_cost = run_single_review_agent(
-        ctx, agent_name, review_type, author, prompt_name
+        ctx, agent_name, review_type, author, prompt_name, output
     )
     return retry_success, retry_sid, cost + retry_cost
 
 
+class _AgentOutput:
+    """Stream writer that prefixes each line with the agent name.
+
+    Keeps the interleaved output of parallel agents readable.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, agent_name: str, stream: TextIO = sys.stdout):
+        self.prefix = f"[{agent_name}] "
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        # Prefix outside the lock, then one write per call to keep the hold short
+        prefixed = "".join(self.prefix + line for line in text.splitlines(keepends=True))
+        with self._lock:
+            self.stream.write(prefixed)
+        return len(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
 # ---------------------------------------------------------------------------
 # Code Review Group (4 parallel agents)
 # ---------------------------------------------------------------------------
 
 
+# Shared by all review chains in the process (lazy loaded)
+_review_pool: ThreadPoolExecutor | None = None
+
+
+def _get_review_pool(settings: Settings) -> ThreadPoolExecutor:
+    """Get the process-wide pool for parallel review sessions.
+
+    Sized by max_claude_concurrency, capped at the number of code review
+    agents, on first use; worker threads are joined by concurrent.futures
+    at interpreter exit.
+    """
+    global _review_pool
+    if _review_pool is None:
+        _review_pool = ThreadPoolExecutor(
+            max_workers=min(len(CODE_REVIEW_AGENTS), settings.max_claude_concurrency),
+            thread_name_prefix="review",
+        )
+    return _review_pool
+
+
 def run_code_reviews(
     ctx: ReviewChainContext,
 ) -> tuple[dict[str, tuple[bool, str | None]], float]:
-    """Run code review agents sequentially with per-agent MCP role switching.
+    """Run code review agents in parallel.
 
-    Each agent gets Reviewer MCP role with its review_type, then SWE is restored.
-    Sequential execution is required because all agents share a single
-    ralph-tasks MCP registration — parallel switching would race.
+    Each agent gets its Reviewer MCP role through a per-session MCP config,
+    so agents do not share the global ralph-tasks registration and can run
+    concurrently.
 
     Returns (results_dict, total_cost) where results_dict is
     {agent_name: (success, session_id)}.
@@ -306,11 +418,18 @@ def run_code_reviews(
     results: dict[str, tuple[bool, str | None]] = {}
     total_cost = 0.0
 
-    for agent_name, review_type, author, prompt_name in CODE_REVIEW_AGENTS:
+    pool = _get_review_pool(ctx.settings)
+    futures = {
+        agent.agent_name: pool.submit(
+            _run_agent_with_retry, ctx, *agent, _AgentOutput(agent.agent_name)
+        )
+        for agent in CODE_REVIEW_AGENTS
+    }
+
+    # Collected in agent order, results only touched from this thread
+    for agent_name, future in futures.items():
         try:
-            success, session_id, cost = _run_agent_with_retry(
-                ctx, agent_name, review_type, author, prompt_name
-            )
+            success, session_id, cost = future.result()
             results[agent_name] = (success, session_id)
             total_cost += cost
             if session_id:
@@ -322,54 +441,71 @@ def run_code_reviews(
     return results, total_cost
 
 
+def _resume_one_reviewer(
+    ctx: ReviewChainContext,
+    agent: ReviewAgent,
+    session_id: str | None,
+    iteration: int,
+    output: TextIO,
+) -> tuple[str | None, float]:
+    """Resume a code reviewer session to re-check after fixes.
+
+    Runs a fresh review when there is no session to resume.
+    Returns (session_id, cost_usd).
+    """
+    if not session_id:
+        _, sid, cost = run_single_review_agent(ctx, *agent, output)
+        return sid, cost
+
+    result = _run_claude(
+        ctx,
+        prompt=REREVIEW_PROMPT,
+        working_dir=ctx.working_dir,
+        log_path=_log_path(ctx, agent.agent_name, f"_rereview{iteration}"),
+        model=ctx.settings.claude_review_model,
+        resume_session=session_id,
+        output=output,
+        mcp_config=mcp_config(McpReviewerRole(agent.review_type), ctx.settings.ralph_tasks_api_key),
+    )
+
+    if result.error_type.is_success:
+        console.print(f"[green]✓ {agent.agent_name} re-review done[/green]")
+    else:
+        console.print(
+            f"[yellow]⚠ {agent.agent_name} re-review failed: {result.error_type.value}[/yellow]"
+        )
+    return result.session_id, result.cost_usd
+
+
 def _resume_reviewers(ctx: ReviewChainContext, iteration: int) -> float:
-    """Resume each code reviewer to re-check after fixes.
+    """Resume all code reviewers in parallel to re-check after fixes.
 
-    Each reviewer runs under its Reviewer MCP role.
+    Each reviewer runs under its Reviewer MCP role (per-session MCP config).
     Returns total cost of all re-review sessions.
     """
-    total_cost = 0.0
-    for agent_name, review_type, author, prompt_name in CODE_REVIEW_AGENTS:
-        session_id = ctx.review_session_ids.get(agent_name)
-        if not session_id:
-            # No session to resume — run fresh (mcp_role handled inside)
-            success, sid, cost = run_single_review_agent(
-                ctx, agent_name, review_type, author, prompt_name
-            )
-            total_cost += cost
-            if sid:
-                ctx.review_session_ids[agent_name] = sid
-            continue
-
-        prompt = (
-            "The implementer has fixed or declined findings. "
-            "Re-review the changes and update finding statuses."
+    pool = _get_review_pool(ctx.settings)
+    futures = {
+        agent.agent_name: pool.submit(
+            _resume_one_reviewer,
+            ctx,
+            agent,
+            ctx.review_session_ids.get(agent.agent_name),
+            iteration,
+            _AgentOutput(agent.agent_name),
         )
-        log_path = _log_path(ctx, agent_name, f"_rereview{iteration}")
+        for agent in CODE_REVIEW_AGENTS
+    }
 
+    total_cost = 0.0
+    for agent_name, future in futures.items():
         try:
-            with mcp_role(McpReviewerRole(review_type), ctx.settings.ralph_tasks_api_key):
-                result = run_claude(
-                    prompt=prompt,
-                    working_dir=ctx.working_dir,
-                    log_path=log_path,
-                    model=ctx.settings.claude_review_model,
-                    resume_session=session_id,
-                )
-        except McpRegistrationError as e:
-            console.print(f"[yellow]⚠ {agent_name} re-review MCP failed: {e}[/yellow]")
+            session_id, cost = future.result()
+        except Exception as e:
+            logger.error("Agent %s re-review raised exception: %s", agent_name, e)
             continue
-
-        total_cost += result.cost_usd
-        if result.session_id:
-            ctx.review_session_ids[agent_name] = result.session_id
-
-        if result.error_type.is_success:
-            console.print(f"[green]✓ {agent_name} re-review done[/green]")
-        else:
-            console.print(
-                f"[yellow]⚠ {agent_name} re-review failed: {result.error_type.value}[/yellow]"
-            )
+        total_cost += cost
+        if session_id:
+            ctx.review_session_ids[agent_name] = session_id
     return total_cost
 
 
@@ -386,7 +522,7 @@ def run_code_review_phase(ctx: ReviewChainContext) -> ReviewPhaseResult:
     console.rule(f"[cyan]Code Review Group: {ctx.task_ref}[/cyan]")
     ctx.session_log.append("Code review group started")
 
-    # Initial review (sequential — MCP role switches per agent)
+    # Initial review (parallel — each agent has its own MCP config)
     results, review_cost = run_code_reviews(ctx)
     phase_cost += review_cost
     succeeded = sum(1 for s, _ in results.values() if s)
@@ -400,6 +536,8 @@ def run_code_review_phase(ctx: ReviewChainContext) -> ReviewPhaseResult:
     ctx.session_log.append(f"Code review: {succeeded}/{len(results)} agents succeeded")
 
     open_count = 0
+    prev_open_count: int | None = None
+    stop_reason = f"max {max_iter} iterations"
     for iteration in range(1, max_iter + 1):
         is_lgtm, open_count = check_lgtm(ctx.project, ctx.task_number, CODE_REVIEW_SECTION_TYPES)
 
@@ -412,6 +550,16 @@ def run_code_review_phase(ctx: ReviewChainContext) -> ReviewPhaseResult:
 
         console.print(f"[yellow]Code review: {open_count} open findings[/yellow]")
 
+        # A fix + re-review round that leaves the count unchanged will not converge
+        if open_count == prev_open_count:
+            stop_reason = "not converging"
+            ctx.session_log.append(
+                f"Code review: LGTM not converging; aborting at iteration {iteration}"
+            )
+            console.print("[yellow]⚠ Code Review: findings not converging[/yellow]")
+            break
+        prev_open_count = open_count
+
         if iteration == max_iter:
             break
 
@@ -426,12 +574,10 @@ def run_code_review_phase(ctx: ReviewChainContext) -> ReviewPhaseResult:
         resume_cost = _resume_reviewers(ctx, iteration + 1)
         phase_cost += resume_cost
 
-    # Max iterations reached
+    # Max iterations reached or not converging
     create_fixup_commit(ctx.working_dir, ctx.session_log, "code review fixes")
-    ctx.session_log.append(
-        f"Code review: max iterations ({max_iter}) reached, {open_count} findings remain"
-    )
-    console.print("[yellow]⚠ Code Review: max iterations reached[/yellow]")
+    ctx.session_log.append(f"Code review: {open_count} findings remain ({stop_reason})")
+    console.print("[yellow]⚠ Code Review: findings remain[/yellow]")
     return ReviewPhaseResult(
         success=True, lgtm=False, cost_usd=phase_cost, findings_count=open_count
     )
@@ -461,7 +607,8 @@ def run_simplifier_phase(ctx: ReviewChainContext) -> ReviewPhaseResult:
 
     log_path = _log_path(ctx, "simplifier")
 
-    result = run_claude(
+    result = _run_claude(
+        ctx,
         prompt=prompt,
         working_dir=ctx.working_dir,
         log_path=log_path,
@@ -509,6 +656,8 @@ def run_security_review_phase(ctx: ReviewChainContext) -> ReviewPhaseResult:
         )
 
     open_count = 0
+    prev_open_count: int | None = None
+    stop_reason = f"max {max_iter} iterations"
     for iteration in range(1, max_iter + 1):
         is_lgtm, open_count = check_lgtm(ctx.project, ctx.task_number, section_types)
 
@@ -521,6 +670,16 @@ def run_security_review_phase(ctx: ReviewChainContext) -> ReviewPhaseResult:
 
         console.print(f"[yellow]Security review: {open_count} open findings[/yellow]")
 
+        # A fix + re-review round that leaves the count unchanged will not converge
+        if open_count == prev_open_count:
+            stop_reason = "not converging"
+            ctx.session_log.append(
+                f"Security review: LGTM not converging; aborting at iteration {iteration}"
+            )
+            console.print("[yellow]⚠ Security Review: findings not converging[/yellow]")
+            break
+        prev_open_count = open_count
+
         if iteration == max_iter:
             break
 
@@ -534,39 +693,31 @@ def run_security_review_phase(ctx: ReviewChainContext) -> ReviewPhaseResult:
         # Re-review (resume security session under Reviewer role)
         sec_session_id = ctx.review_session_ids.get("security-reviewer")
         if sec_session_id:
-            prompt = (
-                "The implementer has fixed or declined security findings. "
-                "Re-review the changes and update finding statuses."
-            )
-            log_path = _log_path(ctx, "security-reviewer", f"_rereview{iteration + 1}")
-            try:
-                with mcp_role(
+            result = _run_claude(
+                ctx,
+                prompt=SECURITY_REREVIEW_PROMPT,
+                working_dir=ctx.working_dir,
+                log_path=_log_path(ctx, "security-reviewer", f"_rereview{iteration + 1}"),
+                model=ctx.settings.claude_review_model,
+                resume_session=sec_session_id,
+                mcp_config=mcp_config(
                     McpReviewerRole("security-review"), ctx.settings.ralph_tasks_api_key
-                ):
-                    result = run_claude(
-                        prompt=prompt,
-                        working_dir=ctx.working_dir,
-                        log_path=log_path,
-                        model=ctx.settings.claude_review_model,
-                        resume_session=sec_session_id,
-                    )
-            except McpRegistrationError as e:
-                console.print(f"[yellow]⚠ Security re-review MCP failed: {e}[/yellow]")
-                continue
+                ),
+            )
             phase_cost += result.cost_usd
             if result.session_id:
                 ctx.review_session_ids["security-reviewer"] = result.session_id
         else:
-            # mcp_role handled inside run_single_review_agent
+            # MCP config handled inside run_single_review_agent
             _, _, rr_cost = run_single_review_agent(
                 ctx, "security-reviewer", "security-review", prompt_name="security-reviewer"
             )
             phase_cost += rr_cost
 
-    # Max iterations
+    # Max iterations reached or not converging
     create_fixup_commit(ctx.working_dir, ctx.session_log, "security fixes")
-    ctx.session_log.append(f"Security review: max iterations ({max_iter}) reached")
-    console.print("[yellow]⚠ Security Review: max iterations reached[/yellow]")
+    ctx.session_log.append(f"Security review: {open_count} findings remain ({stop_reason})")
+    console.print("[yellow]⚠ Security Review: findings remain[/yellow]")
     return ReviewPhaseResult(
         success=True, lgtm=False, cost_usd=phase_cost, findings_count=open_count
     )
@@ -577,6 +728,45 @@ def run_security_review_phase(ctx: ReviewChainContext) -> ReviewPhaseResult:
 # ---------------------------------------------------------------------------
 
 
+# Shell-style exit codes for processes killed by a signal or a timeout wrapper
+_EXIT_CODE_REASONS = {
+    124: "timed out",
+    137: "killed by SIGKILL, possibly out of memory",
+    143: "terminated by SIGTERM",
+}
+
+
+def _describe_exit_code(returncode: int) -> str:
+    """Describe a non-zero exit code, naming the signal when there is one."""
+    if returncode < 0:
+        try:
+            return f"Exit code {returncode} (killed by {signal.Signals(-returncode).name})"
+        except ValueError:
+            return f"Exit code {returncode}"
+    reason = _EXIT_CODE_REASONS.get(returncode)
+    if reason:
+        return f"Exit code {returncode} ({reason})"
+    return f"Exit code {returncode}"
+
+
+def _wait_or_terminate(proc: subprocess.Popen, timeout: int) -> bool:
+    """Wait for process; terminate it after timeout seconds.
+
+    Returns True if the process had to be terminated.
+    """
+    try:
+        proc.wait(timeout=timeout)
+        return False
+    except subprocess.TimeoutExpired:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        return True
+
+
 def _run_codex_iterations(
     ctx: ReviewChainContext,
     initial_prompt: str,
@@ -585,6 +775,7 @@ def _run_codex_iterations(
 ) -> ReviewPhaseResult:
     """Run codex review iterations (called under codex_mcp_role context)."""
     phase_cost = 0.0
+    timeout = ctx.settings.review_timeout
 
     for iteration in range(1, max_iter + 1):
         console.print(f"[cyan]Codex review iteration {iteration}/{max_iter}[/cyan]")
@@ -615,30 +806,37 @@ def _run_codex_iterations(
 
         start_time = time.time()
         try:
-            with open(log_path, "w") as log_file:
+            # Codex output is never parsed, so it goes straight to the log file
+            with open(log_path, "wb") as log_file:
                 proc = subprocess.Popen(
                     cmd,
                     cwd=ctx.working_dir,
-                    stdout=subprocess.PIPE,
+                    stdin=subprocess.DEVNULL,
+                    stdout=log_file,
                     stderr=subprocess.STDOUT,
                 )
-                for raw_line in proc.stdout:
-                    line = raw_line.decode("utf-8", errors="replace")
-                    log_file.write(line)
-                proc.wait()
+                timed_out = _wait_or_terminate(proc, timeout)
 
             duration = int(time.time() - start_time)
 
+            if timed_out:
+                console.print(f"[red]Codex review timed out after {format_duration(timeout)}[/red]")
+                ctx.session_log.append(f"Codex review timed out at iteration {iteration}")
+                return ReviewPhaseResult(
+                    success=False,
+                    error=f"Timed out after {timeout}s",
+                    cost_usd=phase_cost,
+                )
+
             if proc.returncode != 0:
+                error = _describe_exit_code(proc.returncode)
                 console.print(
-                    f"[red]Codex review failed "
-                    f"(exit {proc.returncode}, "
-                    f"{format_duration(duration)})[/red]"
+                    f"[red]Codex review failed ({error}, {format_duration(duration)})[/red]"
                 )
-                ctx.session_log.append(f"Codex review failed at iteration {iteration}")
+                ctx.session_log.append(f"Codex review failed at iteration {iteration}: {error}")
                 return ReviewPhaseResult(
                     success=False,
-                    error=f"Exit code {proc.returncode}",
+                    error=error,
                     cost_usd=phase_cost,
                 )
 
@@ -751,7 +949,8 @@ def run_finalization_phase(ctx: ReviewChainContext) -> ReviewPhaseResult:
 
     log_path = _log_path(ctx, "finalization")
 
-    result = run_claude(
+    result = _run_claude(
+        ctx,
         prompt=prompt,
         working_dir=ctx.working_dir,
         log_path=log_path,
@@ -815,29 +1014,30 @@ def run_review_chain(
     console.rule(f"[bold blue]Review Chain: {task_ref}[/bold blue]")
     session_log.append(f"Review chain started: {task_ref}")
 
-    log_dir_str = str(ctx.log_dir)
-
     # Phase 1: Code Review Group
     code_review = run_code_review_phase(ctx)
-    if not code_review.success:
-        notifier.review_failed(
-            task_ref, "Code Review Group", code_review.error or "Unknown", log_dir_str
-        )
 
     # Phase 2: Code Simplifier
     simplifier = run_simplifier_phase(ctx)
 
     # Phase 3: Security Review
     security = run_security_review_phase(ctx)
-    if not security.success:
-        notifier.review_failed(
-            task_ref, "Security Review", security.error or "Unknown", log_dir_str
-        )
 
     # Phase 4: Codex Review
     codex = run_codex_review_phase(ctx)
-    if not codex.success:
-        notifier.review_failed(task_ref, "Codex Review", codex.error or "Unknown", log_dir_str)
+
+    # One notification for all failed review phases
+    failures = [
+        (name, result.error or "Unknown")
+        for name, result in (
+            ("Code Review Group", code_review),
+            ("Security Review", security),
+            ("Codex Review", codex),
+        )
+        if not result.success
+    ]
+    if failures:
+        notifier.reviews_failed(task_ref, failures, str(ctx.log_dir))
 
     # Phase 5: Finalization
     finalization = run_finalization_phase(ctx)
@@ -853,9 +1053,12 @@ def run_review_chain(
         ("Finalization", "finalization", finalization),
     ]
 
-    phase_results = {key: result for _, key, result in phases}
+    phase_results: dict[str, ReviewPhaseResult] = {}
+    total_cost = 0.0
 
-    for name, _, result in phases:
+    for name, key, result in phases:
+        phase_results[key] = result
+        total_cost += result.cost_usd
         if result.lgtm and result.success:
             status = "[green]✓ LGTM[/green]"
         elif not result.success:
@@ -864,8 +1067,6 @@ def run_review_chain(
             status = "[yellow]⚠ Issues remain[/yellow]"
         console.print(f"  {name}: {status}")
 
-    total_cost = sum(r.cost_usd for r in phase_results.values())
-
     return ReviewChainResult(
         success=finalization.success,
         total_cost_usd=total_cost,
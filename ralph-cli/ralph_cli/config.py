@@ -1,5 +1,6 @@
 """Configuration loading with pydantic-settings."""
 
+from functools import cache
 from pathlib import Path
 
 from pydantic import Field
@@ -33,6 +34,10 @@ class Settings(BaseSettings):
     code_review_max_iterations: int = 3
     security_review_max_iterations: int = 2
 
+    # Claude CLI throttling (more than a few concurrent sessions trigger CLI rate limits)
+    max_claude_concurrency: int = Field(default=2, ge=1)
+    claude_rpm: int = Field(default=10, ge=1)  # session starts per minute
+
     # Codex review settings
     codex_review_max_iterations: int = 3
     codex_review_model: str = "gpt-5.3-codex"
@@ -51,19 +56,12 @@ class Settings(BaseSettings):
         return bool(self.telegram_bot_token and self.telegram_chat_id)
 
 
-# Global settings instance (lazy loaded)
-_settings: Settings | None = None
-
-
+@cache
 def get_settings() -> Settings:
-    """Get global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """Get global settings instance (loaded on first call)."""
+    return Settings()
 
 
 def reset_settings() -> None:
     """Reset global settings instance (for testing)."""
-    global _settings
-    _settings = None
+    get_settings.cache_clear()
@@ -3,6 +3,7 @@
 import re
 from enum import Enum
 from pathlib import Path
+from typing import NamedTuple
 
 
 class ErrorType(Enum):
@@ -21,12 +22,7 @@ class ErrorType(Enum):
     @property
     def is_recoverable(self) -> bool:
         """Check if error is recoverable with retry."""
-        return self in {
-            ErrorType.AUTH_EXPIRED,
-            ErrorType.API_TIMEOUT,
-            ErrorType.RATE_LIMIT,
-            ErrorType.OVERLOADED,
-        }
+        return self in _RECOVERABLE
 
     @property
     def is_fatal(self) -> bool:
@@ -44,36 +40,142 @@ class ErrorType(Enum):
         return self == ErrorType.CONTEXT_OVERFLOW
 
 
-# Patterns for text-based classification (order matters - first match wins)
-_PATTERNS: list[tuple[ErrorType, list[str]]] = [
+# Built once for ErrorType.is_recoverable (enum members do not exist in the class body)
+_RECOVERABLE = frozenset(
+    {
+        ErrorType.AUTH_EXPIRED,
+        ErrorType.API_TIMEOUT,
+        ErrorType.RATE_LIMIT,
+        ErrorType.OVERLOADED,
+    }
+)
+
+
+# Patterns for text-based classification (order matters - first match wins).
+# Matching ignores case.
+_PATTERN_SOURCES: list[tuple[ErrorType, list[str]]] = [
     (ErrorType.COMPLETED, [r"I confirm that all task phases are fully completed"]),
     (ErrorType.CONTEXT_OVERFLOW, [r"Prompt is too long", r"context.*overflow"]),
-    (ErrorType.AUTH_EXPIRED, [r"401", r"[Uu]nauthorized", r"authentication.*failed"]),
+    (ErrorType.AUTH_EXPIRED, [r"401", r"unauthorized", r"authentication.*failed"]),
     (ErrorType.RATE_LIMIT, [r"429", r"rate.?limit", r"too.many.requests"]),
-    (ErrorType.OVERLOADED, [r"529", r"[Oo]verloaded"]),
-    (ErrorType.FORBIDDEN, [r"403", r"[Ff]orbidden"]),
+    (ErrorType.OVERLOADED, [r"529", r"overloaded"]),
+    (ErrorType.FORBIDDEN, [r"403", r"forbidden"]),
     (ErrorType.API_TIMEOUT, [r"Tokens: 0 in / 0 out"]),
     (ErrorType.ON_HOLD, [r"status.*hold", r"## Blocks", r"→ hold"]),
 ]
 
+_REGEX_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+class _Matcher(NamedTuple):
+    """Compiled checks for one error type."""
+
+    error_type: ErrorType
+    literals: tuple[str, ...]  # lowercased patterns without regex syntax
+    anchors: tuple[tuple[str, ...], ...]  # literal runs each regex pattern requires
+    regex: re.Pattern[str] | None  # alternation of the remaining patterns
+
+
+def _literal_runs(pattern: str) -> tuple[str, ...]:
+    """Literal pieces between ``.``, ``.*`` and ``.?`` wildcards.
+
+    Empty when the pattern uses any other regex syntax, so no prefilter applies.
+    """
+    runs = tuple(run.lower() for run in re.split(r"\.[*?]?", pattern) if run)
+    if any(c in _REGEX_CHARS for run in runs for c in run):
+        return ()
+    return runs
+
+
+def _build_matcher(error_type: ErrorType, patterns: list[str]) -> _Matcher:
+    literals = tuple(p.lower() for p in patterns if not _REGEX_CHARS.intersection(p))
+    regexes = [p for p in patterns if _REGEX_CHARS.intersection(p)]
+    return _Matcher(
+        error_type,
+        literals,
+        tuple(_literal_runs(p) for p in regexes),
+        re.compile("|".join(f"(?:{p})" for p in regexes), re.IGNORECASE) if regexes else None,
+    )
+
+
+# Built once at import; classify_from_text runs on every task log
+_MATCHERS: list[_Matcher] = [_build_matcher(t, patterns) for t, patterns in _PATTERN_SOURCES]
+
+# No pattern can match text shorter than this (literal length, or the
+# total of a regex pattern's literal runs)
+_MIN_MATCH_LEN = min(
+    [len(literal) for m in _MATCHERS for literal in m.literals]
+    + [sum(map(len, runs)) for m in _MATCHERS for runs in m.anchors]
+)
+
+
+def _first_match(text: str, limit: int) -> int:
+    """Index in ``_MATCHERS`` of the first type matching ``text``, or ``limit``.
+
+    Only types before ``limit`` are checked.
+    """
+    if len(text) < _MIN_MATCH_LEN:
+        return limit
+    lowered = text.lower()
+    for index, matcher in enumerate(_MATCHERS[:limit]):
+        if any(literal in lowered for literal in matcher.literals):
+            return index
+        if matcher.regex is not None and any(
+            all(run in lowered for run in runs) for runs in matcher.anchors
+        ):
+            if matcher.regex.search(text):
+                return index
+    return limit
+
 
 def classify_from_text(text: str) -> ErrorType:
-    """Classify error type from raw text."""
-    for error_type, patterns in _PATTERNS:
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return error_type
-    return ErrorType.UNKNOWN
+    """Classify error type from raw text.
+
+    Literal patterns are plain substring checks on the lowercased text; the
+    regex runs only once every literal run of some regex pattern is present.
+    """
+    index = _first_match(text, len(_MATCHERS))
+    return _MATCHERS[index].error_type if index < len(_MATCHERS) else ErrorType.UNKNOWN
+
+
+# Session logs reach several MB; classify_from_log scans them in pieces this big
+_LOG_CHUNK_SIZE = 1024 * 1024
 
 
 def classify_from_log(log_path: Path) -> ErrorType:
-    """Classify error type from log file."""
+    """Classify error type from log file.
+
+    Reads the file in chunks of whole lines (no pattern spans a newline),
+    keeping the highest-priority match so far and stopping once nothing
+    can beat it.
+    """
     if not log_path.exists():
         return ErrorType.UNKNOWN
+    best = len(_MATCHERS)
     try:
-        return classify_from_text(log_path.read_text())
+        # Undecodable bytes must not hide the markers around them
+        with log_path.open(encoding="utf-8", errors="ignore") as f:
+            while best and (chunk := f.read(_LOG_CHUNK_SIZE)):
+                best = _first_match(chunk + f.readline(), best)
     except Exception:
         return ErrorType.UNKNOWN
+    return _MATCHERS[best].error_type if best < len(_MATCHERS) else ErrorType.UNKNOWN
+
+
+# Checks for JSON error results (order matters - first match wins). Each
+# check is a set of alternatives; an alternative matches when all of its
+# substrings occur in the lowercased error text.
+_JSON_CHECKS: list[tuple[ErrorType, str, tuple[tuple[str, ...], ...]]] = [
+    (
+        ErrorType.CONTEXT_OVERFLOW,
+        "Prompt is too long - context overflow",
+        (("prompt is too long",),),
+    ),
+    (ErrorType.AUTH_EXPIRED, "Authentication failed (401)", (("401",), ("unauthorized",))),
+    (ErrorType.RATE_LIMIT, "Rate limited (429)", (("429",), ("rate", "limit"))),
+    (ErrorType.OVERLOADED, "API overloaded (529)", (("529",), ("overloaded",))),
+    (ErrorType.FORBIDDEN, "Forbidden (403)", (("403",), ("forbidden",))),
+]
 
 
 def classify_from_json(data: dict) -> tuple[ErrorType, str]:
@@ -86,16 +188,9 @@ def classify_from_json(data: dict) -> tuple[ErrorType, str]:
     errors = data.get("errors", [])
     all_text = f"{error_msg} {error_code} {' '.join(str(e) for e in errors)}".lower()
 
-    if "prompt is too long" in all_text:
-        return ErrorType.CONTEXT_OVERFLOW, "Prompt is too long - context overflow"
-    if "401" in all_text or "unauthorized" in all_text:
-        return ErrorType.AUTH_EXPIRED, "Authentication failed (401)"
-    if "429" in all_text or "rate" in all_text and "limit" in all_text:
-        return ErrorType.RATE_LIMIT, "Rate limited (429)"
-    if "529" in all_text or "overloaded" in all_text:
-        return ErrorType.OVERLOADED, "API overloaded (529)"
-    if "403" in all_text or "forbidden" in all_text:
-        return ErrorType.FORBIDDEN, "Forbidden (403)"
+    for error_type, detail, alternatives in _JSON_CHECKS:
+        if any(all(s in all_text for s in substrings) for substrings in alternatives):
+            return error_type, detail
 
     usage = data.get("usage", {})
     if usage.get("input_tokens", 0) == 0 and usage.get("output_tokens", 0) == 0:
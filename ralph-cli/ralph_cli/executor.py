@@ -9,13 +9,25 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TextIO
 
-from .errors import ErrorType, classify_from_text
+from .errors import ErrorType, classify_from_log
 from .logging import TaskLog, format_duration
+from .mcp import mcp_config_file
 from .monitor import StreamMonitor
 
 # Env vars that prevent nested Claude Code sessions
 _CLAUDE_SESSION_VARS = {"CLAUDECODE", "CLAUDE_CODE_ENTRYPOINT"}
 
+# Fixed tail of every non-interactive claude invocation
+_CLAUDE_ARGS = (
+    "--output-format",
+    "stream-json",
+    "--verbose",
+    "--dangerously-skip-permissions",
+)
+
+# Task reference ("project#42") named in a prompt, used for log headers
+_TASK_REF_RE = re.compile(r"(\w+#\d+)")
+
 
 def _clean_env() -> dict[str, str]:
     """Return env dict without Claude session vars to allow nested launches."""
@@ -94,6 +106,7 @@ def run_claude(
     model: str = "opus",
     resume_session: str | None = None,
     output: TextIO = sys.stdout,
+    mcp_config: str | None = None,
 ) -> TaskResult:
     """Execute Claude with given prompt.
 
@@ -104,28 +117,20 @@ def run_claude(
         model: Model to use (opus, sonnet, haiku)
         resume_session: Session ID to resume
         output: Stream for formatted output
+        mcp_config: MCP config JSON for this session only; replaces the
+            user-level MCP servers (--strict-mcp-config). Passed to claude
+            through a temp file that is removed when the run ends
 
     Returns:
         TaskResult with execution details
     """
     # Build command
-    cmd = [
-        "claude",
-        "-p",
-        prompt,
-        "--model",
-        model,
-        "--output-format",
-        "stream-json",
-        "--verbose",
-        "--dangerously-skip-permissions",
-    ]
-
+    cmd = ("claude", "-p", prompt, "--model", model, *_CLAUDE_ARGS)
     if resume_session:
-        cmd.extend(["--resume", resume_session])
+        cmd += ("--resume", resume_session)
 
     # Extract task_ref from prompt for logging
-    task_ref_match = re.search(r"(\w+#\d+)", prompt)
+    task_ref_match = _TASK_REF_RE.search(prompt)
     task_ref = task_ref_match.group(1) if task_ref_match else "unknown"
 
     start_time = time.time()
@@ -133,7 +138,14 @@ def run_claude(
     # Raw JSON log path (same name with .json extension)
     raw_json_path = log_path.with_suffix(".json")
 
-    with TaskLog(log_path) as task_log, open(raw_json_path, "w") as raw_json_file:
+    with (
+        mcp_config_file(mcp_config) as mcp_config_path,
+        TaskLog(log_path) as task_log,
+        open(raw_json_path, "w") as raw_json_file,
+    ):
+        if mcp_config_path:
+            cmd += ("--mcp-config", str(mcp_config_path), "--strict-mcp-config")
+
         task_log.write_header(task_ref)
 
         # Create monitor with both output and log file
@@ -182,7 +194,7 @@ def run_claude(
             session_id = result.session_id
         else:
             # Fallback to log-based classification
-            error_type = classify_from_text(log_path.read_text())
+            error_type = classify_from_log(log_path)
             session_id = None
 
         # Write footer
@@ -9,12 +9,12 @@ from git.exc import GitCommandError, InvalidGitRepositoryError
 logger = logging.getLogger(__name__)
 
 # Directories to exclude from cleanup checks
-EXCLUDE_PATTERNS = [".claude/"]
+EXCLUDE_PATTERNS = (".claude/",)
 
 
 def _is_excluded(path: str) -> bool:
     """Check if path should be excluded from cleanup."""
-    return any(path.startswith(pattern) for pattern in EXCLUDE_PATTERNS)
+    return path.startswith(EXCLUDE_PATTERNS)
 
 
 def get_repo(working_dir: Path) -> Repo | None:
@@ -25,6 +25,41 @@ def get_repo(working_dir: Path) -> Repo | None:
         return None
 
 
+def _status(repo: Repo) -> list[tuple[str, str]]:
+    """Read ``(XY, path)`` entries from one ``git status --porcelain -z`` call.
+
+    X is the index status against HEAD, Y the worktree status against the
+    index; untracked files are ``??``. A rename or copy yields both paths.
+    """
+    fields = repo.git.status("--porcelain=v1", "-z", "--untracked-files=all").split("\0")
+    entries = []
+    i = 0
+    while i < len(fields):
+        entry = fields[i]
+        i += 1
+        if not entry:
+            continue
+        xy, path = entry[:2], entry[3:]
+        entries.append((xy, path))
+        if "R" in xy or "C" in xy:
+            entries.append((xy, fields[i]))
+            i += 1
+    return entries
+
+
+def _files_to_clean(repo: Repo) -> tuple[list[str], list[str]]:
+    modified = []
+    untracked = []
+    for xy, path in _status(repo):
+        if _is_excluded(path):
+            continue
+        if xy == "??":
+            untracked.append(path)
+        elif xy[1] != " ":
+            modified.append(path)
+    return modified, untracked
+
+
 def get_files_to_clean(working_dir: Path) -> tuple[list[str], list[str]]:
     """Get list of files that would be cleaned.
 
@@ -36,17 +71,7 @@ def get_files_to_clean(working_dir: Path) -> tuple[list[str], list[str]]:
     repo = get_repo(working_dir)
     if not repo:
         return [], []
-
-    modified = []
-    untracked = []
-
-    if repo.is_dirty(untracked_files=True):
-        for item in repo.index.diff(None):
-            if not _is_excluded(item.a_path):
-                modified.append(item.a_path)
-        untracked = [f for f in repo.untracked_files if not _is_excluded(f)]
-
-    return modified, untracked
+    return _files_to_clean(repo)
 
 
 def cleanup_working_dir(working_dir: Path) -> list[str]:
@@ -55,7 +80,7 @@ def cleanup_working_dir(working_dir: Path) -> list[str]:
     Excludes files in EXCLUDE_PATTERNS (e.g., .claude/).
 
     Runs:
-        git checkout -- . (excluding patterns)
+        git checkout -- <modified files>
         git clean -fd --exclude=<patterns>
 
     Returns list of cleaned files.
@@ -64,15 +89,20 @@ def cleanup_working_dir(working_dir: Path) -> list[str]:
     if not repo:
         return []
 
-    modified, untracked = get_files_to_clean(working_dir)
+    modified, untracked = _files_to_clean(repo)
     cleaned = modified + untracked
 
-    # Reset tracked files (only non-excluded)
-    for filepath in modified:
+    # Reset tracked files (only non-excluded) in one checkout; if that fails,
+    # retry per file so one bad path does not leave the rest modified
+    if modified:
         try:
-            repo.git.checkout("--", filepath)
-        except GitCommandError as e:
-            logger.debug("git checkout %s failed: %s", filepath, e)
+            repo.git.checkout("--", *modified)
+        except GitCommandError:
+            for filepath in modified:
+                try:
+                    repo.git.checkout("--", filepath)
+                except GitCommandError as e:
+                    logger.debug("git checkout %s failed: %s", filepath, e)
 
     # Remove untracked files (excluding patterns)
     try:
@@ -85,32 +115,14 @@ def cleanup_working_dir(working_dir: Path) -> list[str]:
 
 
 def get_uncommitted_changes(working_dir: Path) -> list[str]:
-    """Return list of modified/untracked files.
+    """Return list of modified/staged/untracked files.
 
     Excludes files in EXCLUDE_PATTERNS (e.g., .claude/).
     """
     repo = get_repo(working_dir)
     if not repo:
         return []
-
-    files = []
-
-    # Modified files
-    for item in repo.index.diff(None):
-        if not _is_excluded(item.a_path):
-            files.append(item.a_path)
-
-    # Staged files
-    for item in repo.index.diff("HEAD"):
-        if not _is_excluded(item.a_path):
-            files.append(item.a_path)
-
-    # Untracked files
-    for f in repo.untracked_files:
-        if not _is_excluded(f):
-            files.append(f)
-
-    return list(set(files))
+    return list(dict.fromkeys(path for _, path in _status(repo) if not _is_excluded(path)))
 
 
 def has_uncommitted_changes(working_dir: Path) -> bool:
@@ -118,7 +130,10 @@ def has_uncommitted_changes(working_dir: Path) -> bool:
 
     Excludes files in EXCLUDE_PATTERNS (e.g., .claude/).
     """
-    return bool(get_uncommitted_changes(working_dir))
+    repo = get_repo(working_dir)
+    if not repo:
+        return False
+    return any(not _is_excluded(path) for _, path in _status(repo))
 
 
 def commit_wip(working_dir: Path, task_ref: str, message: str) -> str | None:
@@ -1,6 +1,7 @@
 """API health check."""
 
 import json
+import re
 import subprocess
 import sys
 from dataclasses import dataclass
@@ -8,6 +9,55 @@ from dataclasses import dataclass
 from .config import Settings, get_settings
 from .errors import ErrorType
 
+# Ordered failure patterns, first match wins
+_FAILURE_PATTERNS = (
+    (r"401|unauthorized", ErrorType.AUTH_EXPIRED),
+    (r"429|rate", ErrorType.RATE_LIMIT),
+    (r"529|overloaded", ErrorType.OVERLOADED),
+)
+
+# Compiled for raw CLI output, scanned without decoding
+_FAILURE_RULES_BYTES: tuple[tuple[re.Pattern[bytes], ErrorType], ...] = tuple(
+    (re.compile(pattern.encode(), re.IGNORECASE), error_type)
+    for pattern, error_type in _FAILURE_PATTERNS
+)
+
+# Rules for an error result from parsed JSON: (error_code, message, type).
+# Narrower than the raw-output rules; first match wins.
+_API_ERROR_RULES: tuple[tuple[re.Pattern[str], re.Pattern[str], ErrorType], ...] = (
+    (re.compile(r"401"), re.compile(r"401"), ErrorType.AUTH_EXPIRED),
+    (re.compile(r"429"), re.compile(r"429|rate", re.IGNORECASE), ErrorType.RATE_LIMIT),
+    (re.compile(r"529"), re.compile(r"529|overloaded", re.IGNORECASE), ErrorType.OVERLOADED),
+)
+
+_RAW_MESSAGES = {
+    ErrorType.AUTH_EXPIRED: "Authentication failed (401)",
+    ErrorType.RATE_LIMIT: "Rate limited (429)",
+    ErrorType.OVERLOADED: "API overloaded (529)",
+}
+
+_API_ERROR_MESSAGES = {
+    ErrorType.AUTH_EXPIRED: "Authentication error",
+    ErrorType.RATE_LIMIT: "Rate limited",
+    ErrorType.OVERLOADED: "API overloaded",
+}
+
+
+def _match_failure(output: bytes) -> ErrorType | None:
+    """Return the first failure type whose pattern matches raw output."""
+    for pattern, error_type in _FAILURE_RULES_BYTES:
+        if pattern.search(output):
+            return error_type
+    return None
+
+
+def _match_api_error(error_code: str, error_msg: str) -> ErrorType | None:
+    """Return the first failure type matching an API error code or message."""
+    for code_pattern, msg_pattern, error_type in _API_ERROR_RULES:
+        if code_pattern.search(error_code) or msg_pattern.search(error_msg):
+            return error_type
+    return None
+
 
 @dataclass
 class HealthResult:
@@ -33,6 +83,11 @@ class HealthResult:
         return mapping.get(self.error_type, 3)
 
 
+def _decode(output: bytes) -> str:
+    """Decode raw CLI output for display."""
+    return output.decode("utf-8", errors="replace")
+
+
 def check_health(verbose: bool = False, settings: Settings | None = None) -> HealthResult:
     """Run health check against Claude API.
 
@@ -57,37 +112,34 @@ def check_health(verbose: bool = False, settings: Settings | None = None) -> Hea
                 "json",
             ],
             capture_output=True,
-            text=True,
             timeout=timeout,
         )
 
+        # Kept as bytes: JSON parsing and failure patterns work on bytes directly
         output = result.stdout + result.stderr
 
         if verbose:
-            print(f"Raw output: {output[:500]}", file=sys.stderr)
+            print(f"Raw output: {_decode(output[:500])}", file=sys.stderr)
 
         # Try to parse JSON (may be multiple objects, take last result)
-        lines = output.strip().split("\n")
         data = None
 
-        for line in reversed(lines):
+        for line in reversed(output.splitlines()):
             try:
                 data = json.loads(line)
                 if data.get("type") == "result":
                     break
-            except json.JSONDecodeError:
+            except ValueError:
                 continue
 
         if data is None:
             # No valid JSON, check raw output
-            lower = output.lower()
-            if "401" in output or "unauthorized" in lower:
-                return HealthResult(ErrorType.AUTH_EXPIRED, "Authentication failed (401)")
-            if "429" in output or "rate" in lower:
-                return HealthResult(ErrorType.RATE_LIMIT, "Rate limited (429)")
-            if "529" in output or "overloaded" in lower:
-                return HealthResult(ErrorType.OVERLOADED, "API overloaded (529)")
-            return HealthResult(ErrorType.UNKNOWN, f"Could not parse response: {output[:200]}")
+            error_type = _match_failure(output)
+            if error_type is not None:
+                return HealthResult(error_type, _RAW_MESSAGES[error_type])
+            return HealthResult(
+                ErrorType.UNKNOWN, f"Could not parse response: {_decode(output[:200])}"
+            )
 
         # Check result type
         if data.get("type") == "result":
@@ -96,14 +148,11 @@ def check_health(verbose: bool = False, settings: Settings | None = None) -> Hea
                 errors = data.get("errors", [])
                 error_msg = "; ".join(str(e) for e in errors) or str(data.get("result", ""))
 
-                if "401" in error_code or "401" in error_msg:
+                error_type = _match_api_error(error_code, error_msg)
+                if error_type is not None:
                     return HealthResult(
-                        ErrorType.AUTH_EXPIRED, f"Authentication error: {error_msg}"
+                        error_type, f"{_API_ERROR_MESSAGES[error_type]}: {error_msg}"
                     )
-                if "429" in error_code or "429" in error_msg or "rate" in error_msg.lower():
-                    return HealthResult(ErrorType.RATE_LIMIT, f"Rate limited: {error_msg}")
-                if "529" in error_code or "529" in error_msg or "overloaded" in error_msg.lower():
-                    return HealthResult(ErrorType.OVERLOADED, f"API overloaded: {error_msg}")
 
                 return HealthResult(ErrorType.UNKNOWN, f"API error: {error_msg}")
 
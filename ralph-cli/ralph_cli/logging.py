@@ -1,6 +1,7 @@
 """Logging utilities using rich."""
 
-from datetime import datetime
+import threading
+import time
 from pathlib import Path
 from typing import TextIO
 
@@ -22,12 +23,12 @@ DIM = "\033[90m"
 
 def timestamp() -> str:
     """Return formatted timestamp."""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return time.strftime("%Y-%m-%d %H:%M:%S")
 
 
 def timestamp_short() -> str:
     """Return short timestamp for inline use."""
-    return datetime.now().strftime("%H:%M:%S")
+    return time.strftime("%H:%M:%S")
 
 
 def format_duration(seconds: int) -> str:
@@ -38,42 +39,72 @@ def format_duration(seconds: int) -> str:
 
 
 class SessionLog:
-    """Session log file writer."""
+    """Session log file writer.
+
+    Keeps one line-buffered handle open for the whole session, so each line
+    still reaches the file as soon as it is written. Review agents append
+    from worker threads; a lock keeps their lines whole.
+    """
 
     def __init__(self, log_path: Path):
         self.log_path = log_path
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: TextIO | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _write(self, text: str, mode: str = "a"):
+        with self._lock:
+            if mode == "w" and self._file:
+                self._file.close()
+                self._file = None
+            if not self._file:
+                self._file = open(self.log_path, mode, buffering=1)
+            self._file.write(text)
 
     def write_header(self, title: str, **fields):
         """Write session header."""
-        with open(self.log_path, "w") as f:
-            f.write(f"{'═' * 60}\n")
-            f.write(f"{title}\n")
-            f.write(f"{'═' * 60}\n\n")
-            f.write(f"Started: {timestamp()}\n")
-            for key, value in fields.items():
-                f.write(f"{key}: {value}\n")
-            f.write(f"\n{'─' * 60}\n")
-            f.write("EXECUTION LOG\n")
-            f.write(f"{'─' * 60}\n")
+        lines = [
+            f"{'═' * 60}\n",
+            f"{title}\n",
+            f"{'═' * 60}\n\n",
+            f"Started: {timestamp()}\n",
+            *(f"{key}: {value}\n" for key, value in fields.items()),
+            f"\n{'─' * 60}\n",
+            "EXECUTION LOG\n",
+            f"{'─' * 60}\n",
+        ]
+        self._write("".join(lines), mode="w")
 
     def append(self, message: str):
         """Append line to log."""
-        with open(self.log_path, "a") as f:
-            f.write(f"[{timestamp()}] {message}\n")
+        self._write(f"[{timestamp()}] {message}\n")
 
     def write_summary(self, **sections):
         """Write session summary."""
-        with open(self.log_path, "a") as f:
-            f.write(f"\n{'─' * 60}\n")
-            f.write("SESSION SUMMARY\n")
-            f.write(f"{'─' * 60}\n\n")
-            f.write(f"Finished: {timestamp()}\n\n")
-            for section, lines in sections.items():
-                f.write(f"{section}:\n")
-                for line in lines:
-                    f.write(f"  {line}\n")
-            f.write(f"\n{'═' * 60}\n")
+        lines = [
+            f"\n{'─' * 60}\n",
+            "SESSION SUMMARY\n",
+            f"{'─' * 60}\n\n",
+            f"Finished: {timestamp()}\n\n",
+        ]
+        for section, section_lines in sections.items():
+            lines.append(f"{section}:\n")
+            lines.extend(f"  {line}\n" for line in section_lines)
+        lines.append(f"\n{'═' * 60}\n")
+        self._write("".join(lines))
+
+    def close(self):
+        """Close the log file; a later write reopens it for appending."""
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
 
 
 class TaskLog:
@@ -6,14 +6,21 @@ before launching Claude, ensuring least-privilege access:
 - SWE (/mcp-swe): update status/report/blocks, reply/decline findings
 - Planner (/mcp-plan): update title/description/plan
 - Reviewer (/mcp-review?review_type=X): add/resolve findings
+
+Review agents get their role through a per-process ``--mcp-config`` instead,
+which lets several reviewers with different roles run at the same time.
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 import re
+import stat
 import subprocess
-from contextlib import contextmanager
+import tempfile
+from contextlib import contextmanager, suppress
 from enum import Enum
 from pathlib import Path
 
@@ -77,6 +84,40 @@ def register_mcp(
     logger.debug("Registered ralph-tasks MCP: %s", url)
 
 
+def mcp_config(role: McpRole | McpReviewerRole, api_key: str | None = None) -> str:
+    """Build ``claude --mcp-config`` JSON with ralph-tasks at the given role.
+
+    Unlike register_mcp, the config applies to a single claude process, so
+    concurrent sessions can each use a different role.
+    """
+    server: dict = {"type": "http", "url": role.url()}
+    if api_key:
+        server["headers"] = {"Authorization": f"Bearer {api_key}"}
+    return json.dumps({"mcpServers": {_MCP_SERVER_NAME: server}})
+
+
+@contextmanager
+def mcp_config_file(config: str | None):
+    """Write ``--mcp-config`` JSON to a private temp file for one claude run.
+
+    The config may carry the ralph-tasks API key, so it is passed by path
+    rather than on the command line, where ``ps`` would show it. The file
+    is created 0600 and removed on exit. Yields None when there is no config.
+    """
+    if not config:
+        yield None
+        return
+
+    fd, tmp = tempfile.mkstemp(prefix="ralph-mcp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(config)
+        yield Path(tmp)
+    finally:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp)
+
+
 @contextmanager
 def mcp_role(
     role: McpRole | McpReviewerRole,
@@ -108,6 +149,23 @@ _CODEX_URL_RE = re.compile(
 )
 
 
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write text via a temp file in the same directory and os.replace.
+
+    Readers (e.g. a codex process starting up) never see a truncated file.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.chmod(tmp, stat.S_IMODE(path.stat().st_mode))
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
 @contextmanager
 def codex_mcp_role(role: McpReviewerRole):
     """Switch Codex config.toml ralph-tasks URL, restore on exit.
@@ -115,6 +173,7 @@ def codex_mcp_role(role: McpReviewerRole):
     Codex has its own MCP config (~/.codex/config.toml), independent from
     Claude's ``claude mcp add/remove``.  This context manager patches the URL
     for the duration of the codex subprocess, then restores the original.
+    Writes are atomic; if the URL already points at the role, nothing is written.
 
     Raises McpRegistrationError if the config file is missing or URL not found.
     """
@@ -123,18 +182,23 @@ def codex_mcp_role(role: McpReviewerRole):
         raise McpRegistrationError(f"Codex config not found: {config}")
 
     original = config.read_text()
-    patched = _CODEX_URL_RE.sub(rf"\1{role.url()}\2", original)
+    patched, count = _CODEX_URL_RE.subn(rf"\1{role.url()}\2", original)
 
-    if patched == original:
+    if count == 0:
         raise McpRegistrationError(
             f"ralph-tasks URL not found in {config} — cannot switch MCP role"
         )
 
-    config.write_text(patched)
+    if patched == original:
+        logger.debug("Codex config MCP URL already set: %s", role.url())
+        yield
+        return
+
+    _atomic_write_text(config, patched)
     logger.debug("Patched codex config MCP URL: %s", role.url())
 
     try:
         yield
     finally:
-        config.write_text(original)
+        _atomic_write_text(config, original)
         logger.debug("Restored codex config MCP URL")
@@ -3,6 +3,7 @@
 import json
 import logging
 import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 
 from .config import get_settings
@@ -87,3 +88,17 @@ def submit_session_metrics(
     except Exception as e:
         logger.warning("Failed to submit metrics: %s", e)
         return False
+
+
+# One background sender; concurrent.futures joins it at interpreter exit,
+# so a queued submission still completes before the CLI quits
+_sender = ThreadPoolExecutor(max_workers=1, thread_name_prefix="metrics")
+
+
+def submit_session_metrics_background(**kwargs) -> Future[bool]:
+    """Submit session metrics on a background thread.
+
+    Takes the same keyword arguments as submit_session_metrics and returns
+    at once, so the HTTP round trip overlaps whatever the caller does next.
+    """
+    return _sender.submit(submit_session_metrics, **kwargs)
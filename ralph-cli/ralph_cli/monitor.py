@@ -19,8 +19,11 @@ from .logging import (
     timestamp_short,
 )
 
+# Color codes stripped from lines copied to the log file
+_ANSI_RE = re.compile(r"\033\[[0-9;]*m")
 
-@dataclass
+
+@dataclass(slots=True)
 class SessionStats:
     """Session statistics."""
 
@@ -32,13 +35,14 @@ class SessionStats:
 
     def add_usage(self, usage: dict, cost: float = 0.0):
         """Add usage data from result."""
-        self.input_tokens += usage.get("input_tokens", 0) + usage.get("cache_read_input_tokens", 0)
+        cache_read = usage.get("cache_read_input_tokens", 0)
+        self.input_tokens += usage.get("input_tokens", 0) + cache_read
         self.output_tokens += usage.get("output_tokens", 0)
-        self.cache_read += usage.get("cache_read_input_tokens", 0)
+        self.cache_read += cache_read
         self.cost_usd += cost
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamResult:
     """Result of processing stream."""
 
@@ -80,12 +84,19 @@ def _format_todos(i: dict) -> str:
     if not todos:
         return "todos cleared"
 
-    in_progress = [t for t in todos if t.get("status") == "in_progress"]
-    completed = sum(1 for t in todos if t.get("status") == "completed")
-    pending = sum(1 for t in todos if t.get("status") == "pending")
-
-    if in_progress:
-        current = in_progress[0].get("activeForm", in_progress[0].get("content", "?"))
+    in_progress = None
+    completed = pending = 0
+    for todo in todos:
+        status = todo.get("status")
+        if status == "completed":
+            completed += 1
+        elif status == "pending":
+            pending += 1
+        elif status == "in_progress" and in_progress is None:
+            in_progress = todo
+
+    if in_progress is not None:
+        current = in_progress.get("activeForm", in_progress.get("content", "?"))
         return f"{current} ({completed}✓ {pending}○)"
 
     if completed == len(todos):
@@ -132,7 +143,9 @@ def _format_bash(i: dict) -> str:
 
 def _format_mcp_tool(name: str, input_data: dict) -> str | None:
     """Format MCP tool calls."""
-    if name.startswith("mcp__ralph-tasks__") or name.startswith("mcp__md-task-mcp__"):
+    if not name.startswith("mcp__"):
+        return None
+    if name.startswith(("mcp__ralph-tasks__", "mcp__md-task-mcp__")):
         action = name.replace("mcp__ralph-tasks__", "").replace("mcp__md-task-mcp__", "")
         project = input_data.get("project", "")
         number = input_data.get("number", "")
@@ -141,10 +154,8 @@ def _format_mcp_tool(name: str, input_data: dict) -> str | None:
         if status:
             result += f" → {status}"
         return result + NC
-    elif name.startswith("mcp__"):
-        short_name = name.replace("mcp__", "")
-        return f"{CYAN}🔌 {short_name}{NC}"
-    return None
+    short_name = name.replace("mcp__", "")
+    return f"{CYAN}🔌 {short_name}{NC}"
 
 
 def _format_tool(name: str, input_data: dict) -> str:
@@ -155,8 +166,9 @@ def _format_tool(name: str, input_data: dict) -> str:
         return mcp_result
 
     # Check known tools
-    if name in TOOL_FORMATS:
-        icon, formatter = TOOL_FORMATS[name]
+    known = TOOL_FORMATS.get(name)
+    if known:
+        icon, formatter = known
         return f"{GREEN}{icon} {formatter(input_data)}{NC}"
 
     # Fallback
@@ -186,17 +198,17 @@ class StreamMonitor:
 
     def _write(self, text: str, timestamp: bool = True):
         """Write formatted output."""
+        now = timestamp_short()
         if timestamp:
-            prefix = f"{DIM}[{timestamp_short()}]{NC} "
-            self.output.write(f"{prefix}{text}\n")
+            self.output.write(f"{DIM}[{now}]{NC} {text}\n")
         else:
             self.output.write(f"{text}\n")
         self.output.flush()
 
         if self.log_file:
             # Strip ANSI for log file
-            clean = re.sub(r"\033\[[0-9;]*m", "", text)
-            self.log_file.write(f"[{timestamp_short()}] {clean}\n")
+            clean = _ANSI_RE.sub("", text) if "\033" in text else text
+            self.log_file.write(f"[{now}] {clean}\n")
             self.log_file.flush()
 
     def _process_init(self, data: dict):
@@ -267,10 +279,10 @@ class StreamMonitor:
 
     def process_line(self, line: str):
         """Process a single JSON line."""
-        # Save raw JSON for diagnostics
+        # Save raw JSON for diagnostics. Left to the file's buffer: nobody
+        # tails this dump, and the caller's `with` flushes it on close.
         if self.raw_json_file:
             self.raw_json_file.write(line + "\n")
-            self.raw_json_file.flush()
 
         try:
             data = json.loads(line)
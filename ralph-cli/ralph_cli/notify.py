@@ -7,36 +7,17 @@ from datetime import datetime
 
 from .config import get_settings
 
+# Telegram Markdown special characters, each escaped with a backslash
+_MARKDOWN_ESCAPES = str.maketrans({char: f"\\{char}" for char in "\\_*[]()~`>#+-=|{}.!"})
+
 
 def escape_markdown(text: str) -> str:
     """Escape special characters for Telegram Markdown.
 
-    Escapes all Markdown special characters to prevent parse errors.
+    Escapes all Markdown special characters to prevent parse errors. One
+    translate pass, so inserted backslashes are never escaped again.
     """
-    # Order matters: escape backslash first
-    for char in [
-        "\\",
-        "_",
-        "*",
-        "[",
-        "]",
-        "(",
-        ")",
-        "~",
-        "`",
-        ">",
-        "#",
-        "+",
-        "-",
-        "=",
-        "|",
-        "{",
-        "}",
-        ".",
-        "!",
-    ]:
-        text = text.replace(char, f"\\{char}")
-    return text
+    return text.translate(_MARKDOWN_ESCAPES)
 
 
 def send_telegram(token: str, chat_id: str, message: str) -> bool:
@@ -218,14 +199,25 @@ Resuming task {task_ref}"""
         self, task_ref: str, review_name: str, reason: str, log_path: str = ""
     ) -> bool:
         """Notify review failure (codex or other)."""
-        lines = [
-            "🚨 *REVIEW FAILED*",
-            "",
-            f"*Task:* {task_ref}",
-            f"*Review:* {escape_markdown(review_name)}",
-            f"*Reason:* {escape_markdown(reason)}",
-            f"*Time:* {datetime.now().strftime('%H:%M')}",
-        ]
+        return self.reviews_failed(task_ref, [(review_name, reason)], log_path)
+
+    def reviews_failed(
+        self, task_ref: str, failures: list[tuple[str, str]], log_path: str = ""
+    ) -> bool:
+        """Notify one or more review failures in a single message.
+
+        Args:
+            task_ref: Task reference
+            failures: (review_name, reason) pairs
+            log_path: Directory or file with review logs
+        """
+        if not failures:
+            return False
+        lines = ["🚨 *REVIEW FAILED*", "", f"*Task:* {task_ref}"]
+        for review_name, reason in failures:
+            lines.append(f"*Review:* {escape_markdown(review_name)}")
+            lines.append(f"*Reason:* {escape_markdown(reason)}")
+        lines.append(f"*Time:* {datetime.now().strftime('%H:%M')}")
         if log_path:
             lines.append(f"*Log:* {escape_markdown(log_path)}")
         return self._send("\n".join(lines))
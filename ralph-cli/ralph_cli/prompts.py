@@ -1,5 +1,6 @@
 """Prompt loading utility for CLI agents."""
 
+from functools import cache, lru_cache
 from pathlib import Path
 
 _PACKAGE_DIR = Path(__file__).resolve().parent
@@ -11,6 +12,25 @@ if not _PROMPTS_DIR.exists():
     _PROMPTS_DIR = _PACKAGE_DIR.parent / "prompts"
 
 
+@cache
+def available_prompts() -> frozenset[str]:
+    """Names of bundled prompts, listed once (the prompts dir does not change at runtime)."""
+    return frozenset(p.stem for p in _PROMPTS_DIR.glob("*.md"))
+
+
+@lru_cache(maxsize=64)
+def load_prompt_template(name: str) -> str:
+    """Read raw prompt template from .md file (cached, prompts ship with the package).
+
+    Raises:
+        FileNotFoundError: If prompt file doesn't exist.
+    """
+    path = _PROMPTS_DIR / f"{name}.md"
+    if name not in available_prompts():
+        raise FileNotFoundError(f"Prompt file not found: {path}")
+    return path.read_text()
+
+
 def load_prompt(name: str, **kwargs: str) -> str:
     """Load prompt from .md file and substitute variables.
 
@@ -24,11 +44,7 @@ def load_prompt(name: str, **kwargs: str) -> str:
     Raises:
         FileNotFoundError: If prompt file doesn't exist.
     """
-    path = _PROMPTS_DIR / f"{name}.md"
-    if not path.exists():
-        raise FileNotFoundError(f"Prompt file not found: {path}")
-
-    text = path.read_text()
+    text = load_prompt_template(name)
     if kwargs:
         text = text.format(**kwargs)
     return text
@@ -0,0 +1,51 @@
+"""Client-side throttling of Claude CLI session starts.
+
+Starting many Claude sessions at once makes the CLI fail with rate-limit
+errors, and retrying them only adds more load. A token bucket spaces out
+session starts before they reach the API.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Holds up to ``capacity`` tokens and refills continuously at
+    ``refill_per_sec`` (default: ``capacity`` per minute). ``acquire``
+    blocks until enough tokens are available.
+    """
+
+    def __init__(self, capacity: int, refill_per_sec: float | None = None):
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec if refill_per_sec is not None else capacity / 60
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_sec)
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Take ``tokens`` from the bucket, waiting for a refill if needed.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens, capacity is {self.capacity}")
+
+        start = time.monotonic()
+        with self._cond:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return time.monotonic() - start
+                self._cond.wait((tokens - self._tokens) / self.refill_per_sec)
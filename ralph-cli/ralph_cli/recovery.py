@@ -7,6 +7,10 @@ from .config import Settings
 from .errors import ErrorType
 from .health import check_health
 
+# Share of each recovery delay to wait before an early health probe; most
+# outages clear well before the conservative configured delay runs out
+_EARLY_PROBE_FRACTION = 0.25
+
 
 def recovery_loop(
     settings: Settings,
@@ -15,6 +19,9 @@ def recovery_loop(
 ) -> bool:
     """Wait and check health with configured delays.
 
+    Each delay is split in two: health is probed once after the first
+    quarter and again when the full delay has passed.
+
     Args:
         settings: Settings with recovery_delays
         on_attempt: Callback(attempt, max_attempts, delay) before each wait
@@ -30,16 +37,14 @@ def recovery_loop(
         if on_attempt:
             on_attempt(attempt, max_attempts, delay)
 
-        # Wait
-        time.sleep(delay)
-
-        # Check health
-        result = check_health()
+        early = delay * _EARLY_PROBE_FRACTION
+        for wait in (early, delay - early):
+            time.sleep(wait)
 
-        if result.is_healthy:
-            if on_recovered:
-                on_recovered()
-            return True
+            if check_health().is_healthy:
+                if on_recovered:
+                    on_recovered()
+                return True
 
     return False
 
@@ -29,28 +29,21 @@ CONTEXT_OVERFLOW_MAX_RETRIES=3
 
 @pytest.fixture
 def temp_git_repo(temp_dir):
-    """Create temporary git repository."""
-    import subprocess
-
-    subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=temp_dir,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=temp_dir,
-        capture_output=True,
-    )
+    """Create temporary git repository.
+
+    Built in-process with GitPython; only ``git init`` runs a subprocess.
+    """
+    from git import Repo
+
+    repo = Repo.init(temp_dir)
+    with repo.config_writer() as config:
+        config.set_value("user", "email", "test@test.com")
+        config.set_value("user", "name", "Test")
 
     # Create initial commit
     (temp_dir / "README.md").write_text("# Test")
-    subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
-        cwd=temp_dir,
-        capture_output=True,
-    )
+    repo.index.add(["README.md"])
+    repo.index.commit("Initial commit")
+    repo.close()
 
     return temp_dir
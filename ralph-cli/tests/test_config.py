@@ -1,6 +1,8 @@
 """Tests for configuration loading."""
 
-from ralph_cli.config import Settings
+import pytest
+from pydantic import ValidationError
+from ralph_cli.config import Settings, get_settings, reset_settings
 
 
 class TestSettings:
@@ -88,3 +90,26 @@ CONTEXT_OVERFLOW_MAX_RETRIES=3
         assert settings.telegram_bot_token == "env_token"
         assert settings.telegram_chat_id == "env_chat"
         assert settings.context_overflow_max_retries == 5
+
+    @pytest.mark.parametrize("name", ["MAX_CLAUDE_CONCURRENCY", "CLAUDE_RPM"])
+    def test_throttling_must_be_positive(self, monkeypatch, name):
+        """Test zero throttling limits are rejected at load time."""
+        monkeypatch.setenv(name, "0")
+        with pytest.raises(ValidationError):
+            Settings(_env_file=None)
+
+
+class TestGetSettings:
+    """Tests for the shared settings instance."""
+
+    def test_cached_until_reset(self, monkeypatch):
+        """Test get_settings reuses one instance until reset_settings."""
+        reset_settings()
+        monkeypatch.setenv("CLAUDE_RPM", "7")
+        first = get_settings()
+        monkeypatch.setenv("CLAUDE_RPM", "8")
+        assert get_settings() is first
+
+        reset_settings()
+        assert get_settings().claude_rpm == 8
+        reset_settings()
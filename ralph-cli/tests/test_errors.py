@@ -1,6 +1,7 @@
 """Tests for error classification."""
 
-from ralph_cli.errors import ErrorType, classify_from_json, classify_from_text
+from ralph_cli import errors
+from ralph_cli.errors import ErrorType, classify_from_json, classify_from_log, classify_from_text
 
 
 class TestErrorType:
@@ -86,6 +87,65 @@ class TestClassifyFromText:
         assert classify_from_text("some random error") == ErrorType.UNKNOWN
         assert classify_from_text("") == ErrorType.UNKNOWN
 
+    def test_shortest_match(self):
+        """Text shorter than any pattern is unknown; the shortest pattern still matches."""
+        assert classify_from_text("40") == ErrorType.UNKNOWN
+        assert classify_from_text("401") == ErrorType.AUTH_EXPIRED
+
+    def test_priority_order(self):
+        """Earlier error types win regardless of position in the text."""
+        text = "Error 429 rate limit\nI confirm that all task phases are fully completed"
+        assert classify_from_text(text) == ErrorType.COMPLETED
+        assert classify_from_text("Overloaded (529), then 401") == ErrorType.AUTH_EXPIRED
+        assert classify_from_text("## Blocks\nforbidden") == ErrorType.FORBIDDEN
+
+    def test_overlapping_matches(self):
+        """A lower-priority match spanning a higher-priority one does not hide it."""
+        assert classify_from_text("status 401 hold") == ErrorType.AUTH_EXPIRED
+
+    def test_literals_ignore_case(self):
+        """Literal patterns match regardless of case."""
+        assert classify_from_text("UNAUTHORIZED") == ErrorType.AUTH_EXPIRED
+        assert classify_from_text("tokens: 0 IN / 0 OUT") == ErrorType.API_TIMEOUT
+
+    def test_anchors_present_without_match(self):
+        """Literal runs in the wrong order still need the regex to match."""
+        assert classify_from_text("overflow before context") == ErrorType.UNKNOWN
+
+
+class TestClassifyFromLog:
+    """Tests for classify_from_log function."""
+
+    def test_missing_file(self, temp_dir):
+        """Test missing log file."""
+        assert classify_from_log(temp_dir / "missing.log") == ErrorType.UNKNOWN
+
+    def test_classifies_file_content(self, temp_dir):
+        """Test classification of log file content."""
+        log = temp_dir / "task.log"
+        log.write_text("Error: 429 Too Many Requests")
+        assert classify_from_log(log) == ErrorType.RATE_LIMIT
+
+    def test_invalid_utf8(self, temp_dir):
+        """Test undecodable bytes do not prevent classification."""
+        log = temp_dir / "task.log"
+        log.write_bytes(b"\xff\xfe garbage\nAPI Error: 529 Overloaded\n")
+        assert classify_from_log(log) == ErrorType.OVERLOADED
+
+    def test_priority_across_chunks(self, temp_dir, monkeypatch):
+        """A higher-priority match in a later chunk still wins."""
+        monkeypatch.setattr(errors, "_LOG_CHUNK_SIZE", 16)
+        log = temp_dir / "task.log"
+        log.write_text("Error 429\n" + "filler line\n" * 10 + "Prompt is too long\n")
+        assert classify_from_log(log) == ErrorType.CONTEXT_OVERFLOW
+
+    def test_pattern_split_by_chunk_boundary(self, temp_dir, monkeypatch):
+        """Chunks end on line boundaries so a marker is never cut in half."""
+        monkeypatch.setattr(errors, "_LOG_CHUNK_SIZE", 4)
+        log = temp_dir / "task.log"
+        log.write_text("x\nAPI overloaded, retrying\n")
+        assert classify_from_log(log) == ErrorType.OVERLOADED
+
 
 class TestClassifyFromJson:
     """Tests for classify_from_json function."""
@@ -108,6 +168,19 @@ class TestClassifyFromJson:
         error_type, _ = classify_from_json(data)
         assert error_type == ErrorType.RATE_LIMIT
 
+    def test_rate_limit_words_apart(self):
+        """Test "rate" and "limit" both present count as a rate limit."""
+        data = {"result": "Request rate exceeded the usage limit"}
+        error_type, detail = classify_from_json(data)
+        assert error_type == ErrorType.RATE_LIMIT
+        assert detail == "Rate limited (429)"
+
+    def test_rate_without_limit(self):
+        """Test "rate" alone is not a rate limit."""
+        data = {"result": "generate failed", "usage": {"input_tokens": 1}}
+        error_type, _ = classify_from_json(data)
+        assert error_type == ErrorType.UNKNOWN
+
     def test_overloaded(self):
         """Test overloaded from JSON."""
         data = {"errors": ["529 overloaded"]}
@@ -1,6 +1,11 @@
 """Tests for executor module."""
 
-from ralph_cli.executor import build_prompt, expand_task_ranges
+import io
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from ralph_cli.executor import _clean_env, build_prompt, expand_task_ranges, run_claude
 
 
 class TestExpandTaskRanges:
@@ -48,3 +53,48 @@ class TestBuildPrompt:
         )
         assert "Previous attempt failed" in prompt
         assert "/ralph-implement-python-task myproject#1" in prompt
+
+
+class TestCleanEnv:
+    """Tests for _clean_env function."""
+
+    def test_removes_session_vars(self, monkeypatch):
+        """Test Claude session vars are stripped."""
+        monkeypatch.setenv("CLAUDECODE", "1")
+        monkeypatch.setenv("RALPH_TEST_VAR", "x")
+        env = _clean_env()
+        assert "CLAUDECODE" not in env
+        assert env["RALPH_TEST_VAR"] == "x"
+
+    def test_reflects_changed_value(self, monkeypatch):
+        """Test a changed value is picked up by the next call."""
+        monkeypatch.setenv("RALPH_TEST_VAR", "old")
+        _clean_env()
+        monkeypatch.setenv("RALPH_TEST_VAR", "new")
+        assert _clean_env()["RALPH_TEST_VAR"] == "new"
+
+
+class TestRunClaudeMcpConfig:
+    """Tests for passing per-session MCP config to claude."""
+
+    def test_config_passed_by_path_not_on_command_line(self, temp_dir):
+        """Test the API key stays off argv and the config file is removed."""
+        config = json.dumps({"mcpServers": {"ralph-tasks": {"headers": {"k": "secret"}}}})
+        seen = {}
+
+        def fake_popen(cmd, **kwargs):
+            path = Path(cmd[cmd.index("--mcp-config") + 1])
+            seen["cmd"] = cmd
+            seen["config"] = path.read_text()
+            seen["path"] = path
+            return MagicMock(stdout=None, wait=MagicMock(return_value=0))
+
+        with patch("ralph_cli.executor.subprocess.Popen", side_effect=fake_popen):
+            run_claude(
+                "prompt", temp_dir, temp_dir / "run.log", output=io.StringIO(), mcp_config=config
+            )
+
+        assert not any("secret" in arg for arg in seen["cmd"])
+        assert "--strict-mcp-config" in seen["cmd"]
+        assert seen["config"] == config
+        assert not seen["path"].exists()
@@ -4,6 +4,7 @@ from ralph_cli.git import (
     cleanup_working_dir,
     commit_wip,
     get_current_branch,
+    get_files_to_clean,
     get_uncommitted_changes,
     has_uncommitted_changes,
 )
@@ -32,6 +33,28 @@ class TestGitOperations:
         changes = get_uncommitted_changes(temp_git_repo)
         assert "new_file.txt" in changes
 
+    def test_uncommitted_changes_include_staged(self, temp_git_repo):
+        """Test staged, modified and untracked files are each listed once."""
+        import subprocess
+
+        (temp_git_repo / "staged.txt").write_text("staged")
+        subprocess.run(["git", "add", "staged.txt"], cwd=temp_git_repo, capture_output=True)
+        (temp_git_repo / "staged.txt").write_text("staged, then modified")
+        (temp_git_repo / "README.md").write_text("modified")
+        (temp_git_repo / "untracked.txt").write_text("new")
+
+        changes = get_uncommitted_changes(temp_git_repo)
+
+        assert sorted(changes) == ["README.md", "staged.txt", "untracked.txt"]
+
+    def test_excluded_changes_ignored(self, temp_git_repo):
+        """Test changes only under excluded dirs do not count."""
+        (temp_git_repo / ".claude").mkdir()
+        (temp_git_repo / ".claude" / "settings.json").write_text("{}")
+
+        assert not has_uncommitted_changes(temp_git_repo)
+        assert get_uncommitted_changes(temp_git_repo) == []
+
     def test_cleanup_working_dir(self, temp_git_repo):
         """Test cleanup removes uncommitted changes."""
         # Create changes
@@ -47,6 +70,35 @@ class TestGitOperations:
         assert len(cleaned) >= 1
         assert not (temp_git_repo / "new_file.txt").exists()
 
+    def test_get_files_to_clean(self, temp_git_repo):
+        """Test modified and untracked files are split, excluded dirs skipped."""
+        (temp_git_repo / "README.md").write_text("modified")
+        (temp_git_repo / "name with spaces.txt").write_text("new")
+        (temp_git_repo / ".claude").mkdir()
+        (temp_git_repo / ".claude" / "settings.json").write_text("{}")
+
+        modified, untracked = get_files_to_clean(temp_git_repo)
+
+        assert modified == ["README.md"]
+        assert untracked == ["name with spaces.txt"]
+
+    def test_cleanup_reverts_all_modified_files(self, temp_git_repo):
+        """Test cleanup restores every modified tracked file."""
+        import subprocess
+
+        for name in ("a.txt", "b.txt"):
+            (temp_git_repo / name).write_text("original")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "add"], cwd=temp_git_repo, capture_output=True)
+        for name in ("a.txt", "b.txt"):
+            (temp_git_repo / name).write_text("changed")
+
+        cleaned = cleanup_working_dir(temp_git_repo)
+
+        assert sorted(cleaned) == ["a.txt", "b.txt"]
+        assert (temp_git_repo / "a.txt").read_text() == "original"
+        assert (temp_git_repo / "b.txt").read_text() == "original"
+
     def test_commit_wip(self, temp_git_repo):
         """Test creating WIP commit."""
         # Create change
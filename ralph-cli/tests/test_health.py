@@ -0,0 +1,123 @@
+"""Tests for API health check."""
+
+import json
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+from ralph_cli.config import Settings
+from ralph_cli.errors import ErrorType
+from ralph_cli.health import check_health
+
+
+@pytest.fixture
+def settings():
+    """Settings without env file."""
+    return Settings(_env_file=None)
+
+
+def _completed(stdout: str = "", stderr: str = "") -> MagicMock:
+    """Create a mock CompletedProcess with bytes output."""
+    result = MagicMock()
+    result.stdout = stdout.encode()
+    result.stderr = stderr.encode()
+    return result
+
+
+class TestCheckHealth:
+    """Tests for check_health function."""
+
+    def test_success(self, settings):
+        """Test successful result is healthy."""
+        output = json.dumps({"type": "result", "is_error": False, "result": "OK"})
+        with patch("ralph_cli.health.subprocess.run", return_value=_completed(output)):
+            result = check_health(settings=settings)
+        assert result.is_healthy
+        assert result.exit_code == 0
+
+    @pytest.mark.parametrize(
+        "output,expected",
+        [
+            ("HTTP 401", ErrorType.AUTH_EXPIRED),
+            ("Unauthorized request", ErrorType.AUTH_EXPIRED),
+            ("Error 429", ErrorType.RATE_LIMIT),
+            ("Rate limit exceeded", ErrorType.RATE_LIMIT),
+            ("529 upstream", ErrorType.OVERLOADED),
+            ("API is Overloaded", ErrorType.OVERLOADED),
+            ("something else", ErrorType.UNKNOWN),
+        ],
+    )
+    def test_raw_output(self, settings, output, expected):
+        """Test classification of non-JSON output."""
+        with patch("ralph_cli.health.subprocess.run", return_value=_completed(stderr=output)):
+            result = check_health(settings=settings)
+        assert result.error_type == expected
+
+    def test_raw_output_priority(self, settings):
+        """Test auth errors take precedence over rate limits."""
+        with patch(
+            "ralph_cli.health.subprocess.run", return_value=_completed(stderr="401 rate limit")
+        ):
+            result = check_health(settings=settings)
+        assert result.error_type == ErrorType.AUTH_EXPIRED
+
+    def test_raw_output_invalid_utf8(self, settings):
+        """Test undecodable output is still classified."""
+        result_mock = MagicMock(stdout=b"\xff\xfe", stderr=b"HTTP 529 Overloaded\n")
+        with patch("ralph_cli.health.subprocess.run", return_value=result_mock):
+            result = check_health(settings=settings)
+        assert result.error_type == ErrorType.OVERLOADED
+
+    def test_api_error_code(self, settings):
+        """Test error code in result JSON is classified."""
+        output = json.dumps(
+            {"type": "result", "is_error": True, "error_code": 529, "errors": ["busy"]}
+        )
+        with patch("ralph_cli.health.subprocess.run", return_value=_completed(output)):
+            result = check_health(settings=settings)
+        assert result.error_type == ErrorType.OVERLOADED
+        assert result.message == "API overloaded: busy"
+
+    @pytest.mark.parametrize(
+        "error_code,errors,expected",
+        [
+            ("", ["HTTP 401"], ErrorType.AUTH_EXPIRED),
+            ("", ["Rate limit exceeded"], ErrorType.RATE_LIMIT),
+            ("", ["Server overloaded"], ErrorType.OVERLOADED),
+            # Unlike raw output, words are not matched in the code or for auth
+            ("", ["Unauthorized"], ErrorType.UNKNOWN),
+            ("rate_limit_error", ["boom"], ErrorType.UNKNOWN),
+        ],
+    )
+    def test_api_error_rules(self, settings, error_code, errors, expected):
+        """Test the JSON error branch keeps its own matching rules."""
+        output = json.dumps(
+            {"type": "result", "is_error": True, "error_code": error_code, "errors": errors}
+        )
+        with patch("ralph_cli.health.subprocess.run", return_value=_completed(output)):
+            result = check_health(settings=settings)
+        assert result.error_type == expected
+
+    def test_api_error_unknown(self, settings):
+        """Test unrecognized API error."""
+        output = json.dumps({"type": "result", "is_error": True, "errors": ["boom"]})
+        with patch("ralph_cli.health.subprocess.run", return_value=_completed(output)):
+            result = check_health(settings=settings)
+        assert result.error_type == ErrorType.UNKNOWN
+        assert result.exit_code == 3
+
+    def test_timeout(self, settings):
+        """Test timeout is reported as API timeout."""
+        with patch(
+            "ralph_cli.health.subprocess.run",
+            side_effect=subprocess.TimeoutExpired("claude", 60),
+        ):
+            result = check_health(settings=settings)
+        assert result.error_type == ErrorType.API_TIMEOUT
+
+    def test_cli_not_found(self, settings):
+        """Test missing claude binary."""
+        with patch("ralph_cli.health.subprocess.run", side_effect=FileNotFoundError):
+            result = check_health(settings=settings)
+        assert result.error_type == ErrorType.UNKNOWN
+        assert result.message == "Claude CLI not found"
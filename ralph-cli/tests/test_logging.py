@@ -0,0 +1,67 @@
+"""Tests for log writers."""
+
+import threading
+
+from ralph_cli.logging import SessionLog, format_duration
+
+
+class TestFormatDuration:
+    def test_formats_hms(self):
+        assert format_duration(3725) == "01:02:05"
+
+    def test_zero(self):
+        assert format_duration(0) == "00:00:00"
+
+
+class TestSessionLog:
+    def test_lines_visible_before_close(self, temp_dir):
+        log_path = temp_dir / "session.log"
+        with SessionLog(log_path) as session_log:
+            session_log.write_header("TITLE", Project="demo")
+            session_log.append("first event")
+            content = log_path.read_text()
+            assert "Project: demo" in content
+            assert content.endswith("] first event\n")
+
+    def test_header_truncates_and_append_reopens(self, temp_dir):
+        log_path = temp_dir / "session.log"
+        log_path.write_text("stale\n")
+        session_log = SessionLog(log_path)
+        session_log.write_header("TITLE")
+        session_log.close()
+        session_log.append("after close")
+        session_log.write_summary(Completed=["1"])
+        session_log.close()
+
+        content = log_path.read_text()
+        assert "stale" not in content
+        assert "] after close\n" in content
+        assert "Completed:\n  1\n" in content
+
+    def test_concurrent_appends_keep_lines_whole(self, temp_dir):
+        log_path = temp_dir / "session.log"
+        with SessionLog(log_path) as session_log:
+            threads = [
+                threading.Thread(
+                    target=lambda n=n: [session_log.append(f"agent{n} {i}") for i in range(50)]
+                )
+                for n in range(4)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        lines = log_path.read_text().splitlines()
+        assert len(lines) == 200
+        assert all(line.startswith("[") and " agent" in line for line in lines)
+
+
+class TestLogDirectory:
+    def test_recreated_after_deletion(self, temp_dir):
+        log_dir = temp_dir / "logs"
+        SessionLog(log_dir / "first.log")
+        log_dir.rmdir()
+        with SessionLog(log_dir / "second.log") as session_log:
+            session_log.append("event")
+        assert (log_dir / "second.log").exists()
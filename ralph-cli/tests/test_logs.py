@@ -1,12 +1,19 @@
 """Tests for logs command."""
 
+import os
+import time
+from unittest.mock import patch
+
 from ralph_cli.commands.logs import (
     LOG_DIRS,
     LogType,
+    clean_logs,
     format_size,
     get_log_files,
+    read_tail_lines,
     resolve_log_path,
 )
+from ralph_cli.config import Settings
 
 
 class TestLogType:
@@ -68,6 +75,23 @@ class TestGetLogFiles:
         result = get_log_files(task_filter="nonexistent#999")
         assert result == []
 
+    def test_lists_log_files(self, temp_dir):
+        """Test collects metadata for .log files only."""
+        hooks_dir = temp_dir / LOG_DIRS[LogType.hooks]
+        hooks_dir.mkdir()
+        (hooks_dir / "proj_1_20260101.log").write_text("hello")
+        (hooks_dir / "proj_2_20260101.log").write_text("x")
+        (hooks_dir / "notes.txt").write_text("ignored")
+
+        settings = Settings(_env_file=None, log_dir=temp_dir)
+        with patch("ralph_cli.commands.logs.get_settings", return_value=settings):
+            result = get_log_files(log_type=LogType.hooks, task_filter="proj#1")
+
+        assert len(result) == 1
+        assert result[0]["path"] == hooks_dir / "proj_1_20260101.log"
+        assert result[0]["type"] == "hooks"
+        assert result[0]["size"] == 5
+
 
 class TestResolveLogPath:
     """Tests for resolve_log_path function."""
@@ -81,3 +105,60 @@ class TestResolveLogPath:
         """Test absolute path that doesn't exist."""
         result = resolve_log_path("/nonexistent/path/file.log")
         assert result is None
+
+
+class TestReadTailLines:
+    """Tests for read_tail_lines function."""
+
+    def test_returns_last_lines(self, temp_dir):
+        """Test returns the last N lines."""
+        log = temp_dir / "test.log"
+        log.write_text("\n".join(f"line {i}" for i in range(100)))
+        assert read_tail_lines(log, 3) == "line 97\nline 98\nline 99"
+
+    def test_spans_multiple_chunks(self, temp_dir):
+        """Test matches a full read when the tail spans several chunks."""
+        log = temp_dir / "test.log"
+        content = "\n".join(f"строка {i}" for i in range(500)) + "\n"
+        log.write_text(content)
+        expected = "\n".join(content.split("\n")[-50:])
+        assert read_tail_lines(log, 50, chunk_size=64) == expected
+
+    def test_more_lines_than_file(self, temp_dir):
+        """Test returns whole file when it has fewer lines than requested."""
+        log = temp_dir / "test.log"
+        log.write_text("a\nb")
+        assert read_tail_lines(log, 10) == "a\nb"
+
+
+class TestCleanLogs:
+    """Tests for clean_logs function."""
+
+    def _make_logs(self, temp_dir):
+        hooks_dir = temp_dir / LOG_DIRS[LogType.hooks]
+        hooks_dir.mkdir()
+        old = hooks_dir / "old.log"
+        old.write_text("old")
+        week_ago = time.time() - 7 * 86400
+        os.utime(old, (week_ago, week_ago))
+        new = hooks_dir / "new.log"
+        new.write_text("new")
+        return old, new
+
+    def test_dry_run_keeps_files(self, temp_dir):
+        """Test dry run does not delete anything."""
+        old, new = self._make_logs(temp_dir)
+        settings = Settings(_env_file=None, log_dir=temp_dir)
+        with patch("ralph_cli.commands.logs.get_settings", return_value=settings):
+            assert clean_logs(LogType.hooks, days=1, dry_run=True) == 0
+        assert old.exists()
+        assert new.exists()
+
+    def test_deletes_only_old_logs(self, temp_dir):
+        """Test only logs older than the cutoff are deleted."""
+        old, new = self._make_logs(temp_dir)
+        settings = Settings(_env_file=None, log_dir=temp_dir)
+        with patch("ralph_cli.commands.logs.get_settings", return_value=settings):
+            assert clean_logs(LogType.hooks, days=1, dry_run=False) == 0
+        assert not old.exists()
+        assert new.exists()
@@ -1,5 +1,6 @@
 """Tests for MCP role switching utilities."""
 
+import json
 from unittest.mock import patch
 
 import pytest
@@ -9,6 +10,8 @@ from ralph_cli.mcp import (
     McpReviewerRole,
     McpRole,
     codex_mcp_role,
+    mcp_config,
+    mcp_config_file,
 )
 
 
@@ -24,6 +27,36 @@ class TestMcpRoleUrl:
         assert role.url() == "http://ai-sbx-ralph-tasks:8000/mcp-review?review_type=security-review"
 
 
+class TestMcpConfig:
+    def test_reviewer_config(self):
+        config = json.loads(mcp_config(McpReviewerRole("code-review")))
+        server = config["mcpServers"]["ralph-tasks"]
+        assert server == {"type": "http", "url": McpReviewerRole("code-review").url()}
+
+    def test_api_key_header(self):
+        config = json.loads(mcp_config(McpRole.SWE, api_key="secret"))
+        headers = config["mcpServers"]["ralph-tasks"]["headers"]
+        assert headers == {"Authorization": "Bearer secret"}
+
+
+class TestMcpConfigFile:
+    def test_writes_private_file_and_removes_it(self):
+        config = mcp_config(McpRole.SWE, api_key="secret")
+        with mcp_config_file(config) as path:
+            assert path.read_text() == config
+            assert path.stat().st_mode & 0o777 == 0o600
+        assert not path.exists()
+
+    def test_removed_on_error(self):
+        with pytest.raises(RuntimeError), mcp_config_file("{}") as path:
+            raise RuntimeError("boom")
+        assert not path.exists()
+
+    def test_no_config_yields_none(self):
+        with mcp_config_file(None) as path:
+            assert path is None
+
+
 class TestCodexUrlRegex:
     """Verify regex matches various URL formats in codex config.toml."""
 
@@ -120,3 +153,33 @@ class TestCodexMcpRole:
                 assert 'profile = "default"' in patched
                 assert 'model = "gpt-5.3-codex"' in patched
                 assert 'command = "playwright-mcp"' in patched
+
+    def test_noop_when_url_already_set(self, tmp_path):
+        config = tmp_path / "config.toml"
+        original_content = (
+            "[mcp_servers.ralph-tasks]\n"
+            'url = "http://ai-sbx-ralph-tasks:8000/mcp-review?review_type=codex-review"\n'
+        )
+        config.write_text(original_content)
+        mtime = config.stat().st_mtime_ns
+
+        with patch("ralph_cli.mcp._CODEX_CONFIG_PATH", config):
+            with codex_mcp_role(McpReviewerRole("codex-review")):
+                assert config.read_text() == original_content
+
+        assert config.read_text() == original_content
+        assert config.stat().st_mtime_ns == mtime
+
+    def test_preserves_file_mode_and_leaves_no_temp_files(self, tmp_path):
+        config = tmp_path / "config.toml"
+        config.write_text(
+            '[mcp_servers.ralph-tasks]\nurl = "http://ai-sbx-ralph-tasks:8000/mcp-swe"\n'
+        )
+        config.chmod(0o640)
+
+        with patch("ralph_cli.mcp._CODEX_CONFIG_PATH", config):
+            with codex_mcp_role(McpReviewerRole("codex-review")):
+                assert config.stat().st_mode & 0o777 == 0o640
+
+        assert config.stat().st_mode & 0o777 == 0o640
+        assert [p.name for p in tmp_path.iterdir()] == ["config.toml"]
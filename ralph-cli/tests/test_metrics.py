@@ -7,7 +7,7 @@ from urllib.error import HTTPError
 
 import pytest
 from ralph_cli.config import Settings
-from ralph_cli.metrics import submit_session_metrics
+from ralph_cli.metrics import submit_session_metrics, submit_session_metrics_background
 
 
 def _mock_ok_response(payload: dict | None = None) -> MagicMock:
@@ -295,3 +295,32 @@ class TestSubmitSessionMetrics:
 
         assert result is False
         mock_logger.warning.assert_called_once()
+
+
+class TestSubmitSessionMetricsBackground:
+    @patch("ralph_cli.metrics.urllib.request.urlopen")
+    def test_submits_on_worker_thread(self, mock_urlopen):
+        """Submission runs off the calling thread and the future carries the result."""
+        import threading
+
+        threads = []
+
+        def _urlopen(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return _mock_ok_response()
+
+        mock_urlopen.side_effect = _urlopen
+
+        with patch("ralph_cli.metrics.get_settings") as mock_settings:
+            mock_settings.return_value = Settings(
+                _env_file=None,
+                ralph_tasks_api_url="http://localhost:8000",
+            )
+            future = submit_session_metrics_background(
+                command_type="implement",
+                project="test",
+                started_at=datetime(2026, 1, 1),
+            )
+            assert future.result(timeout=5) is True
+
+        assert threads and threads[0] is not threading.current_thread()
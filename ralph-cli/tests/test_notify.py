@@ -0,0 +1,47 @@
+"""Tests for Telegram notifications."""
+
+from unittest.mock import patch
+
+from ralph_cli.notify import Notifier, escape_markdown
+
+
+def _notifier() -> Notifier:
+    return Notifier(token="token", chat_id="chat")
+
+
+class TestEscapeMarkdown:
+    def test_escapes_special_chars(self):
+        assert escape_markdown("a_b*c") == "a\\_b\\*c"
+
+    def test_escapes_backslash_first(self):
+        assert escape_markdown("\\_") == "\\\\\\_"
+
+    def test_plain_text_unchanged(self):
+        assert escape_markdown("hello world") == "hello world"
+
+
+class TestReviewsFailed:
+    @patch("ralph_cli.notify.send_telegram", return_value=True)
+    def test_single_message_for_all_failures(self, mock_send):
+        notifier = _notifier()
+        assert notifier.reviews_failed(
+            "proj#1", [("Code Review", "timeout"), ("Codex Review", "exit 1")], "/logs"
+        )
+        mock_send.assert_called_once()
+        message = mock_send.call_args[0][2]
+        assert "*Review:* Code Review" in message
+        assert "*Reason:* timeout" in message
+        assert "*Review:* Codex Review" in message
+        assert "*Log:* /logs" in message
+
+    @patch("ralph_cli.notify.send_telegram", return_value=True)
+    def test_empty_failures_sends_nothing(self, mock_send):
+        assert _notifier().reviews_failed("proj#1", []) is False
+        mock_send.assert_not_called()
+
+    @patch("ralph_cli.notify.send_telegram", return_value=True)
+    def test_review_failed_delegates(self, mock_send):
+        _notifier().review_failed("proj#1", "Security Review", "boom")
+        message = mock_send.call_args[0][2]
+        assert "*Review:* Security Review" in message
+        assert "*Reason:* boom" in message
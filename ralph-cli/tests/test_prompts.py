@@ -1,7 +1,9 @@
 """Tests for prompt loading utility."""
 
+from unittest.mock import patch
+
 import pytest
-from ralph_cli.prompts import load_prompt
+from ralph_cli.prompts import available_prompts, load_prompt, load_prompt_template
 
 
 class TestLoadPrompt:
@@ -30,6 +32,28 @@ class TestLoadPrompt:
         with pytest.raises(FileNotFoundError, match="nonexistent"):
             load_prompt("nonexistent")
 
+    def test_template_read_once(self):
+        load_prompt_template.cache_clear()
+        with patch("pathlib.Path.read_text", return_value="Task {task_ref}") as mock_read:
+            assert load_prompt("fix-review-issues", task_ref="proj#1") == "Task proj#1"
+            assert load_prompt("fix-review-issues", task_ref="proj#2") == "Task proj#2"
+        mock_read.assert_called_once()
+        load_prompt_template.cache_clear()
+
+    def test_missing_prompt_does_not_touch_filesystem(self):
+        available_prompts()  # warm the listing
+        with (
+            patch("pathlib.Path.exists") as mock_exists,
+            patch("pathlib.Path.read_text") as mock_read,
+        ):
+            with pytest.raises(FileNotFoundError):
+                load_prompt("nonexistent")
+        mock_exists.assert_not_called()
+        mock_read.assert_not_called()
+
+    def test_available_prompts_lists_bundled(self):
+        assert {"fix-review-issues", "code-simplifier", "finalization"} <= available_prompts()
+
     def test_substitution_replaces_all_vars(self):
         text = load_prompt(
             "fix-review-issues",
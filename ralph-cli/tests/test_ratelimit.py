@@ -0,0 +1,43 @@
+"""Tests for Claude session throttling."""
+
+import threading
+import time
+
+import pytest
+from ralph_cli.ratelimit import TokenBucket
+
+
+class TestTokenBucket:
+    def test_burst_up_to_capacity(self):
+        bucket = TokenBucket(3, refill_per_sec=0.001)
+        waits = [bucket.acquire() for _ in range(3)]
+        assert all(w < 0.05 for w in waits)
+
+    def test_waits_for_refill(self):
+        bucket = TokenBucket(1, refill_per_sec=20)
+        bucket.acquire()
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+
+    def test_default_refill_is_capacity_per_minute(self):
+        assert TokenBucket(30).refill_per_sec == pytest.approx(0.5)
+
+    def test_shared_between_threads(self):
+        bucket = TokenBucket(2, refill_per_sec=20)
+        start = time.monotonic()
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # 2 immediate, 2 more need 0.1s of refill in total
+        assert time.monotonic() - start >= 0.09
+
+    def test_rejects_more_than_capacity(self):
+        with pytest.raises(ValueError, match="capacity is 2"):
+            TokenBucket(2).acquire(3)
+
+    def test_rejects_zero_capacity(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0)
@@ -0,0 +1,46 @@
+"""Tests for the API recovery loop."""
+
+from unittest.mock import MagicMock, patch
+
+from ralph_cli.config import Settings
+from ralph_cli.errors import ErrorType
+from ralph_cli.health import HealthResult
+from ralph_cli.recovery import recovery_loop
+
+_HEALTHY = HealthResult(ErrorType.COMPLETED, "ok")
+_DOWN = HealthResult(ErrorType.OVERLOADED, "down")
+
+
+def _settings(*delays: int) -> Settings:
+    return Settings(_env_file=None, recovery_delays=list(delays))
+
+
+class TestRecoveryLoop:
+    @patch("ralph_cli.recovery.time.sleep")
+    @patch("ralph_cli.recovery.check_health", return_value=_HEALTHY)
+    def test_early_probe_skips_rest_of_delay(self, mock_health, mock_sleep):
+        on_recovered = MagicMock()
+
+        assert recovery_loop(_settings(400), on_recovered=on_recovered)
+
+        mock_sleep.assert_called_once_with(100)
+        mock_health.assert_called_once()
+        on_recovered.assert_called_once()
+
+    @patch("ralph_cli.recovery.time.sleep")
+    @patch("ralph_cli.recovery.check_health", side_effect=[_DOWN, _HEALTHY])
+    def test_probes_again_after_full_delay(self, mock_health, mock_sleep):
+        assert recovery_loop(_settings(400))
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [100, 300]
+
+    @patch("ralph_cli.recovery.time.sleep")
+    @patch("ralph_cli.recovery.check_health", return_value=_DOWN)
+    def test_all_attempts_fail(self, mock_health, mock_sleep):
+        on_attempt = MagicMock()
+
+        assert not recovery_loop(_settings(40, 80), on_attempt=on_attempt)
+
+        assert [c.args for c in on_attempt.call_args_list] == [(1, 2, 40), (2, 2, 80)]
+        assert sum(c.args[0] for c in mock_sleep.call_args_list) == 120
+        assert mock_health.call_count == 4
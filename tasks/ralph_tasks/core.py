@@ -668,6 +668,13 @@ def count_open_findings(project: str) -> dict[int, int]:
         return crud.count_open_findings_by_task(session, project)
 
 
+def count_open_task_findings(project: str, number: int, section_types: list[str]) -> int:
+    """Return the number of open findings of a task in the given section types."""
+    project = normalize_project_name(project)
+    with _session() as session:
+        return crud.count_open_task_findings(session, project, number, section_types)
+
+
 def reply_to_finding(finding_id: str, text: str, author: str) -> dict:
     """Add a comment to a finding."""
     with _session() as session:
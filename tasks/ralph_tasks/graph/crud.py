@@ -844,6 +844,30 @@ def count_open_findings_by_task(session: Session, project_name: str) -> dict[int
     return {r["task_number"]: r["open_count"] for r in result}
 
 
+def count_open_task_findings(
+    session: Session,
+    project_name: str,
+    task_number: int,
+    section_types: list[str],
+) -> int:
+    """Return the number of open findings of a task in the given section types.
+
+    Counted in Cypher, so findings and their comments are not transferred.
+    """
+    result = session.run(
+        """
+        MATCH (p:Project {name: $project})-[:HAS_TASK]->(t:Task {number: $number})
+              -[:HAS_SECTION]->(s:Section)-[:HAS_FINDING]->(f:Finding {status: 'open'})
+        WHERE s.type IN $section_types
+        RETURN count(f) AS open_count
+        """,
+        project=project_name,
+        number=task_number,
+        section_types=section_types,
+    )
+    return result.single()["open_count"]
+
+
 # ---------------------------------------------------------------------------
 # Comment
 # ---------------------------------------------------------------------------
@@ -474,6 +474,25 @@ class TestFindingCRUD:
         counts = crud.count_open_findings_by_task(neo4j_session, "proj")
         assert counts == {1: 1, 2: 2}
 
+    def test_count_open_task_findings(self, neo4j_session):
+        crud.create_workspace(neo4j_session, "ws")
+        crud.create_project(neo4j_session, "ws", "proj")
+        crud.create_task(neo4j_session, "proj", "Task 1")
+        crud.create_task(neo4j_session, "proj", "Task 2")
+
+        crud.create_finding(neo4j_session, "proj", 1, "code-review", "Issue 1", "rev")
+        crud.create_finding(neo4j_session, "proj", 1, "security", "Sec issue", "rev")
+        f3 = crud.create_finding(neo4j_session, "proj", 1, "code-review", "Issue 2", "rev")
+        crud.update_finding_status(neo4j_session, f3["element_id"], "resolved")
+        crud.create_finding(neo4j_session, "proj", 1, "codex-review", "Codex issue", "rev")
+        # Other task is not counted
+        crud.create_finding(neo4j_session, "proj", 2, "code-review", "Issue B", "rev")
+
+        count = crud.count_open_task_findings(neo4j_session, "proj", 1, ["code-review", "security"])
+        assert count == 2
+        assert crud.count_open_task_findings(neo4j_session, "proj", 1, ["codex-review"]) == 1
+        assert crud.count_open_task_findings(neo4j_session, "proj", 1, ["other"]) == 0
+
     def test_repeated_review_adds_findings(self, neo4j_session):
         """New findings are added without removing old ones."""
         crud.create_workspace(neo4j_session, "ws")